@@ -0,0 +1,147 @@
+import cocotb
+from cocotb.handle import HierarchyArrayObject, HierarchyObject
+from cocotb.triggers import RisingEdge
+
+
+def _bit(signal):
+    """X/Z 값은 0으로 취급하여 정수로 변환"""
+    value = signal.value
+    return int(value) if value.is_resolvable else 0
+
+
+def _is_simple_fifo(handle):
+    """모듈 정의명(_def_name)이 있으면 그것으로, 없으면 used_w/full/empty 포트 유무로 판별"""
+    def_name = getattr(handle, "_def_name", None)
+    if def_name:
+        return def_name == "simple_fifo"
+    try:
+        handle.used_w
+        handle.full
+        handle.empty
+    except AttributeError:
+        return False
+    return True
+
+
+def find_simple_fifos(dut, prefix=""):
+    """DUT 하위 계층 전체에서 simple_fifo 인스턴스를 재귀적으로 찾는다.
+
+    신호 핸들은 건너뛰고 모듈/generate 계층만 내려간다.
+    반환 dict의 키는 DUT 기준 계층 경로 (예: "u_core.u_fifo").
+    """
+    fifos = {}
+    for child in dut:
+        if not isinstance(child, (HierarchyObject, HierarchyArrayObject)):
+            continue
+        name = prefix + child._name
+        if _is_simple_fifo(child):
+            fifos[name] = child
+        else:
+            fifos.update(find_simple_fifos(child, name + "."))
+    return fifos
+
+
+def fifo_depth(handle):
+    """simple_fifo 핸들의 FIFO_DEPTH 파라미터를 읽고, 접근이 안되면 used_w 폭으로 추정한다."""
+    try:
+        return int(handle.FIFO_DEPTH.value)
+    except (AttributeError, ValueError):
+        # used_w 폭 = $clog2(FIFO_DEPTH) + 1
+        return 1 << (len(handle.used_w) - 1)
+
+
+class FifoStats:
+    """단일 FIFO의 점유율 통계 (히스토그램, Full/Empty 사이클, 최대 점유)"""
+
+    def __init__(self, name, depth, bins=8):
+        self.name = name
+        self.depth = depth
+        self.bins = bins
+        self.histogram = [0] * bins
+        self.cycles = 0
+        self.peak = 0
+        self.full_cycles = 0
+        self.empty_cycles = 0
+        self.full_stalls = 0   # wr_en 인데 full 이라 쓰기가 버려진 사이클
+        self.empty_stalls = 0  # rd_en 인데 empty 라 소비할 데이터가 없던 사이클
+
+    def sample(self, used, full, empty, wr_en=0, rd_en=0):
+        self.cycles += 1
+        # used == depth 인 경우도 마지막 bin에 포함
+        self.histogram[min(used * self.bins // self.depth, self.bins - 1)] += 1
+        if used > self.peak:
+            self.peak = used
+        if full:
+            self.full_cycles += 1
+            if wr_en:
+                self.full_stalls += 1
+        if empty:
+            self.empty_cycles += 1
+            if rd_en:
+                self.empty_stalls += 1
+
+    def report(self, log, test_name=""):
+        prefix = f"[{test_name}] " if test_name else ""
+        log.info(f"{prefix}FIFO {self.name} (depth={self.depth}): "
+                 f"cycles={self.cycles}, peak={self.peak} ({100.0 * self.peak / self.depth:.1f}%), "
+                 f"full={self.full_cycles} (stall {self.full_stalls}), "
+                 f"empty={self.empty_cycles} (stall {self.empty_stalls})")
+        step = self.depth / self.bins
+        for i, count in enumerate(self.histogram):
+            pct = 100.0 * count / self.cycles if self.cycles else 0.0
+            log.info(f"{prefix}  {int(i * step):5d}-{int((i + 1) * step):5d}: "
+                     f"{count:8d} ({pct:5.1f}%) {'#' * int(pct / 2)}")
+
+
+class FifoMonitor:
+    """DUT 안의 모든 simple_fifo 인스턴스의 used_w/full/empty를 매 클럭 샘플링한다.
+
+    사용 예:
+        fifo_mon = FifoMonitor(dut)
+        fifo_mon.start()
+        ... (transfer) ...
+        fifo_mon.stop()
+        fifo_mon.report("test_burst_master_basic")
+    """
+
+    def __init__(self, dut, bins=8, clk=None):
+        self.dut = dut
+        self.clk = clk if clk is not None else dut.clk
+        self.log = dut._log
+        self.fifos = find_simple_fifos(dut)
+        self.stats = {
+            name: FifoStats(name, fifo_depth(fifo), bins)
+            for name, fifo in self.fifos.items()
+        }
+        self._task = None
+
+    def start(self):
+        if not self.fifos:
+            self.log.warning(f"FifoMonitor: no simple_fifo instance found in {self.dut._name}")
+            return
+        self.log.info(f"FifoMonitor: tracking {', '.join(self.fifos)}")
+        self._task = cocotb.start_soon(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
+
+    async def _run(self):
+        # 핸들 조회를 루프 밖으로 빼서 샘플링 비용을 최소화
+        probes = [
+            (self.stats[name], fifo.used_w, fifo.full, fifo.empty, fifo.wr_en, fifo.rd_en)
+            for name, fifo in self.fifos.items()
+        ]
+        while True:
+            await RisingEdge(self.clk)
+            for stats, used_w, full, empty, wr_en, rd_en in probes:
+                used = used_w.value
+                if not used.is_resolvable:  # 리셋 이전 X 구간은 건너뜀
+                    continue
+                stats.sample(int(used), _bit(full), _bit(empty), _bit(wr_en), _bit(rd_en))
+
+    def report(self, test_name=""):
+        for stats in self.stats.values():
+            stats.report(self.log, test_name)
+        return self.stats
@@ -0,0 +1,217 @@
+"""
+Soak 테스트 공용 도구 (장시간 실행, 메모리 사용량 고정)
+
+보드에서는 엔진이 몇 시간씩 돌면서 카운터/주소 레지스터가 wrap 된다.
+tb_soak.py 는 정해진 시뮬레이션 사이클 수 또는 wall time 동안 전송/스트림을 연속으로 흘리고,
+여기의 도구들로 메모리를 일정하게 유지한다.
+    - RingScoreboard  : 기대값은 in-flight 만큼만, 불일치는 최근 N개만 보관
+    - ThroughputWindows: 고정 크기 윈도우별 Throughput (전체 이력 대신 min/max/평균 + 최근 N개)
+    - soak_word        : 주소로부터 결정적으로 생성되는 데이터 (메모리 모델에 저장하지 않음)
+
+사용 예 (기본은 OFF):
+    SOAK_CYCLES=2000000 pytest test_runner.py
+    SOAK_SECONDS=3600 SOAK_WINDOW=50000 pytest test_runner.py -k burst_master
+"""
+import os
+import resource
+import time
+from collections import deque
+
+MASK32 = 0xFFFFFFFF
+
+
+class SoakBudget:
+    """SOAK_CYCLES / SOAK_SECONDS 중 먼저 도달하는 쪽에서 종료"""
+
+    def __init__(self, cycles=None, seconds=None):
+        self.cycles = cycles
+        self.seconds = seconds
+        self._start = time.monotonic()
+
+    @classmethod
+    def from_env(cls, environ=None):
+        """환경 변수에서 예산을 읽는다. 둘 다 없으면 None (soak 비활성)"""
+        environ = os.environ if environ is None else environ
+        cycles = int(float(environ.get("SOAK_CYCLES", 0)))
+        seconds = float(environ.get("SOAK_SECONDS", 0))
+        if cycles <= 0 and seconds <= 0:
+            return None
+        return cls(cycles or None, seconds or None)
+
+    def elapsed(self):
+        return time.monotonic() - self._start
+
+    def exhausted(self, cycle):
+        if self.cycles is not None and cycle >= self.cycles:
+            return True
+        return self.seconds is not None and self.elapsed() >= self.seconds
+
+    def __str__(self):
+        parts = []
+        if self.cycles is not None:
+            parts.append(f"{self.cycles} cycles")
+        if self.seconds is not None:
+            parts.append(f"{self.seconds:.0f} s wall time")
+        return " or ".join(parts)
+
+
+def soak_word(addr, seed=0):
+    """주소(와 seed)로부터 32-bit 데이터를 결정적으로 생성 (xorshift 혼합)"""
+    x = (addr ^ (seed * 0x9E3779B9)) & MASK32
+    x ^= (x << 13) & MASK32
+    x ^= x >> 17
+    x ^= (x << 5) & MASK32
+    return x ^ 0x5A5A0000
+
+
+def byteswap32(x):
+    return int.from_bytes((x & MASK32).to_bytes(4, "little"), "big")
+
+
+def stream_expected(word, coeff, bypass=False):
+    """stream_processor 레인 1개의 기대 출력 (엔디안 변환 -> * coeff -> * 5243 >> 21 -> 엔디안 복원)"""
+    if bypass:
+        return word & MASK32
+    prod = byteswap32(word) * (coeff & MASK32)
+    result = ((prod * 5243) & 0xFFFFFFFFFFFFFFFF) >> 21
+    return byteswap32(result)
+
+
+def rss_mb():
+    """프로세스 최대 RSS (MB). Linux는 KB, macOS는 Byte 단위"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if os.uname().sysname == "Darwin" else peak / 1024
+
+
+def _fmt(value):
+    return f"0x{value:X}" if isinstance(value, int) else repr(value)
+
+
+class RingScoreboard:
+    """in-flight 기대값만 보관하는 순서 보장 스코어보드
+
+    DUT가 순서를 바꾸지 않으므로 FIFO 매칭으로 충분하다. 기대값 큐가 depth를 넘으면
+    DUT가 출력을 잃어버린 것이므로 에러로 처리한다 (메모리가 무한히 늘지 않도록).
+    """
+
+    def __init__(self, name, depth=1024, keep_mismatches=8):
+        self.name = name
+        self.depth = depth
+        self.expected = deque()
+        self.mismatches = deque(maxlen=keep_mismatches)
+        self.matched = 0
+        self.errors = 0
+
+    def push(self, value):
+        if len(self.expected) >= self.depth:
+            raise AssertionError(f"[{self.name}] {len(self.expected)} items in flight: output lost?")
+        self.expected.append(value)
+
+    def check(self, got, where=None):
+        if not self.expected:
+            raise AssertionError(f"[{self.name}] Unexpected output {_fmt(got)}")
+        exp = self.expected.popleft()
+        if got == exp:
+            self.matched += 1
+            return True
+        self.errors += 1
+        self.mismatches.append(f"{where if where is not None else self.matched + self.errors}: "
+                               f"Expected {_fmt(exp)}, Got {_fmt(got)}")
+        return False
+
+    @property
+    def pending(self):
+        return len(self.expected)
+
+
+class ThroughputWindows:
+    """고정 길이(cycles) 윈도우별 Throughput 집계
+
+    각 윈도우가 끝날 때마다 (items / window) 를 기록하되, 전체 이력 대신
+    누적 min/max/합계와 최근 keep 개만 보관한다. 첫 warmup 개 윈도우는 기준에서 제외.
+    """
+
+    def __init__(self, window, warmup=1, keep=8):
+        self.window = window
+        self.warmup = warmup
+        self.recent = deque(maxlen=keep)
+        self.windows = 0
+        self.items = 0
+        self.cycles = 0
+        self.total_items = 0
+        self.total_cycles = 0
+        self.min = None
+        self.max = None
+        self._sum = 0.0
+        self._steady = 0
+
+    def sample(self, items=0):
+        """1 사이클 진행. 윈도우가 끝나면 그 윈도우의 Throughput을 반환 (아니면 None)"""
+        self.items += items
+        self.cycles += 1
+        if self.cycles < self.window:
+            return None
+        rate = self.items / self.cycles
+        self.total_items += self.items
+        self.total_cycles += self.cycles
+        self.items = self.cycles = 0
+        self.windows += 1
+        self.recent.append(rate)
+        if self.windows > self.warmup:
+            self.min = rate if self.min is None else min(self.min, rate)
+            self.max = rate if self.max is None else max(self.max, rate)
+            self._sum += rate
+            self._steady += 1
+        return rate
+
+    @property
+    def mean(self):
+        return self._sum / self._steady if self._steady else 0.0
+
+    def steady(self, tolerance):
+        """warmup 이후 모든 윈도우가 평균 대비 ±tolerance 이내인지"""
+        if not self._steady:
+            return True
+        return self.min >= self.mean * (1 - tolerance) and self.max <= self.mean * (1 + tolerance)
+
+    def summary(self):
+        return {
+            "windows": self.windows,
+            "min": self.min or 0.0,
+            "mean": self.mean,
+            "max": self.max or 0.0,
+            "recent": list(self.recent),
+        }
+
+
+class SoakReport:
+    """per-beat 로그 대신 report_every 사이클마다 한 줄 요약을 남긴다"""
+
+    def __init__(self, log, label, report_every):
+        self.log = log
+        self.label = label
+        self.report_every = report_every
+        self.rss_start = rss_mb()
+        self.rss_peak = self.rss_start
+
+    def mark_baseline(self):
+        """warmup 이 끝난 시점의 RSS를 기준으로 삼는다 (시뮬레이터/파이썬 초기화분 제외)"""
+        self.rss_start = self.rss_peak = rss_mb()
+
+    def maybe_report(self, cycle, budget, scoreboard, windows, extra=""):
+        if cycle % self.report_every:
+            return
+        self.report(cycle, budget, scoreboard, windows, extra)
+
+    def report(self, cycle, budget, scoreboard, windows, extra=""):
+        self.rss_peak = rss_mb()
+        s = windows.summary()
+        last = s["recent"][-1] if s["recent"] else 0.0
+        self.log.info(f"[Soak {self.label}] cycle={cycle} wall={budget.elapsed():.0f}s "
+                      f"ok={scoreboard.matched} err={scoreboard.errors} in_flight={scoreboard.pending} "
+                      f"rate last/min/mean/max = {last:.3f}/{s['min']:.3f}/{s['mean']:.3f}/{s['max']:.3f} "
+                      f"rss={self.rss_peak:.0f}MB{' ' + extra if extra else ''}")
+
+    @property
+    def rss_growth(self):
+        return self.rss_peak - self.rss_start
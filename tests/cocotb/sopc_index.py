@@ -0,0 +1,287 @@
+"""
+sopcinfo 인덱스 (Platform Designer 시스템 정보 -> 테스트 설정)
+
+custom_inst_qsys.sopcinfo (약 3MB XML)를 iterparse로 스트리밍 파싱하여
+모듈/인터페이스/클럭/주소 맵만 담은 작은 인덱스를 만들고, 파일 해시(SHA-256) 기준으로
+JSON 캐시에 저장한다. 이후 로드는 캐시를 바로 읽으므로 즉시 끝난다.
+
+테스트벤치와 리포트는 여기서 실제 클럭 주기와 주소를 가져와
+사이클 수를 시스템 클럭 기준 MB/s 로 환산한다.
+
+사용 예:
+    python sopc_index.py                     # 요약 출력
+    python sopc_index.py --module stream_multdiv_simd_0
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_SOPCINFO = os.path.join(PROJ_PATH, "custom_inst_qsys.sopcinfo")
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sopc_cache")
+INDEX_VERSION = 2
+
+# 인덱스에 남길 모듈 파라미터 (클럭 소스 주파수, Nios II 코어 구성)
+MODULE_PARAMS = ("clockFrequency", "impl", "multiplierType", "dividerType")
+# 인덱스에 남길 인터페이스 파라미터
+INTERFACE_PARAMS = (
+    "clockRate", "associatedClock", "addressSpan", "readLatency",
+    "maximumPendingReadTransactions", "dataBitsPerSymbol", "symbolsPerBeat", "readyLatency",
+)
+DATA_ROLES = ("data", "readdata", "writedata")
+# 단독 실행(test_runner 없이) 시 클럭 주기: 시스템 클럭 clk_0 = 50MHz
+DEFAULT_CLOCK_PERIOD_NS = 20.0
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def env_clock_period_ns():
+    """테스트벤치용 시스템 클럭 주기 (test_runner가 sopcinfo에서 읽어 CLOCK_PERIOD_NS 로 전달)"""
+    return float(os.environ.get("CLOCK_PERIOD_NS", DEFAULT_CLOCK_PERIOD_NS))
+
+
+def mb_per_s(nbytes, cycles, clock_period_ns):
+    """cycles 동안 nbytes 를 옮긴 대역폭을 클럭 주기 기준 MB/s 로 환산"""
+    if not cycles:
+        return 0.0
+    return nbytes * 1000.0 / (cycles * clock_period_ns)
+
+
+def _params(elem, wanted=None):
+    params = {}
+    for p in elem.findall("parameter"):
+        name = p.get("name")
+        if wanted is None or name in wanted:
+            params[name] = p.findtext("value")
+    return params
+
+
+def _to_number(text):
+    try:
+        return int(text, 0)
+    except (TypeError, ValueError):
+        return text
+
+
+def _index_module(elem):
+    module = {
+        "kind": elem.get("kind"),
+        "path": elem.get("path"),
+        "params": {k: _to_number(v) for k, v in _params(elem, MODULE_PARAMS).items()},
+        "interfaces": {},
+    }
+
+    for itf in elem.findall("interface"):
+        ports = {}
+        for port in itf.findall("port"):
+            ports[port.findtext("name")] = {
+                "role": port.findtext("role"),
+                "width": _to_number(port.findtext("width")),
+                "direction": port.findtext("direction"),
+            }
+        data_width = max((p["width"] for p in ports.values() if p["role"] in DATA_ROLES), default=None)
+        entry = {
+            "kind": itf.get("kind"),
+            "params": {k: _to_number(v) for k, v in _params(itf, INTERFACE_PARAMS).items()},
+            "ports": ports,
+            "data_width": data_width,
+        }
+        blocks = [
+            {
+                "slave": mb.findtext("name"),
+                "base": int(mb.findtext("baseAddress")),
+                "span": int(mb.findtext("span")),
+                "bridge": mb.findtext("isBridge") == "true",
+            }
+            for mb in itf.findall("memoryBlock")
+        ]
+        if blocks:
+            entry["address_map"] = sorted(blocks, key=lambda b: b["base"])
+        module["interfaces"][itf.get("name")] = entry
+    return module
+
+
+def build_index(path):
+    """iterparse로 sopcinfo를 스트리밍 파싱하여 인덱스 dict를 만든다.
+
+    최상위 module/connection 요소를 처리한 직후 clear() 하므로 전체 트리를 메모리에 유지하지 않는다.
+    """
+    modules = {}
+    connections = []
+    depth = 0
+    root = None
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = elem
+            depth += 1
+            continue
+        depth -= 1
+        if depth != 1:
+            continue
+        if elem.tag == "module":
+            modules[elem.get("name")] = _index_module(elem)
+        elif elem.tag == "connection":
+            connections.append({
+                "kind": elem.get("kind"),
+                "start": elem.get("start"),
+                "end": elem.get("end"),
+                "params": _params(elem, ("baseAddress",)),
+            })
+        root.clear()
+
+    # 클럭 도메인 해석: clock 연결(start=소스 인터페이스)을 따라 주파수를 찾는다
+    clocks = {}
+    for name, module in modules.items():
+        for iname, itf in module["interfaces"].items():
+            if itf["kind"] == "clock_source":
+                rate = itf["params"].get("clockRate") or module["params"].get("clockFrequency")
+                if isinstance(rate, int) and rate > 0:
+                    clocks[f"{name}.{iname}"] = rate
+
+    clock_of = {}
+    for conn in connections:
+        if conn["kind"] == "clock" and conn["start"] in clocks:
+            clock_of[conn["end"]] = conn["start"]
+
+    for name, module in modules.items():
+        for iname, itf in module["interfaces"].items():
+            if itf["kind"] == "clock_sink" and f"{name}.{iname}" in clock_of:
+                itf["clock_source"] = clock_of[f"{name}.{iname}"]
+                module.setdefault("clock_source", itf["clock_source"])
+
+    return {
+        "version": INDEX_VERSION,
+        "source": os.path.abspath(path),
+        "modules": modules,
+        "clocks": clocks,
+        "connections": [c for c in connections if c["kind"] != "clock"],
+        "hdl_toplevels": scan_hw_tcl(os.path.dirname(os.path.abspath(path))),
+    }
+
+
+def scan_hw_tcl(proj_path):
+    """*_hw.tcl 에서 Qsys 컴포넌트 kind -> HDL top-level 모듈명을 찾는다."""
+    mapping = {}
+    for tcl in glob.glob(os.path.join(proj_path, "*_hw.tcl")):
+        with open(tcl) as f:
+            text = f.read()
+        name = re.search(r"set_module_property\s+NAME\s+(\S+)", text)
+        top = re.search(r"set_fileset_property\s+QUARTUS_SYNTH\s+TOP_LEVEL\s+(\S+)", text)
+        if name and top:
+            mapping[name.group(1)] = top.group(1)
+    return mapping
+
+
+class SopcIndex:
+    """sopcinfo 인덱스 조회 헬퍼"""
+
+    SYSTEM_CLOCK = "clk_0.clk"
+
+    def __init__(self, data):
+        self.data = data
+        self.modules = data["modules"]
+        self.clocks = data["clocks"]
+
+    def instances_of(self, toplevel):
+        """HDL top-level 모듈명(예: stream_processor_simd)에 해당하는 시스템 인스턴스 목록"""
+        kinds = {kind for kind, top in self.data["hdl_toplevels"].items() if top == toplevel}
+        return sorted(name for name, m in self.modules.items() if m["kind"] in kinds)
+
+    def _instance(self, name):
+        """인스턴스명 또는 HDL top-level 모듈명을 인스턴스명으로 변환 (없으면 None)"""
+        if name in self.modules:
+            return name
+        instances = self.instances_of(name)
+        return instances[0] if instances else None
+
+    def clock_hz(self, name=None):
+        """인스턴스(또는 HDL 모듈)의 클럭 주파수. 시스템에 없으면 시스템 클럭(clk_0)"""
+        instance = self._instance(name) if name else None
+        source = self.modules[instance].get("clock_source") if instance else None
+        return self.clocks.get(source) or self.clocks[self.SYSTEM_CLOCK]
+
+    def clock_period_ns(self, name=None):
+        return 1e9 / self.clock_hz(name)
+
+    def base_address(self, slave, master="nios2_gen2_0.data_master"):
+        """master 주소 맵에서 slave 인터페이스(예: 'mmio_0.s0')의 base address"""
+        module, _, itf = master.partition(".")
+        for block in self.modules[module]["interfaces"][itf].get("address_map", []):
+            if block["slave"] == slave:
+                return block["base"]
+        raise KeyError(f"{slave} is not mapped in {master}")
+
+    def interface(self, name, itf):
+        return self.modules[self._instance(name)]["interfaces"][itf]
+
+    def csr_words(self, name, itf="avalon_slave_0"):
+        """Avalon-MM slave의 레지스터(word) 개수 = addressSpan / 4"""
+        return self.interface(name, itf)["params"]["addressSpan"] // 4
+
+    def mb_per_s(self, nbytes, cycles, name=None):
+        """사이클 수를 실제 시스템 클럭 기준 MB/s 로 환산"""
+        return mb_per_s(nbytes, cycles, self.clock_period_ns(name))
+
+
+def load_index(path=DEFAULT_SOPCINFO, cache_dir=DEFAULT_CACHE_DIR):
+    """캐시(파일 해시 기준)가 있으면 읽고, 없으면 파싱 후 캐시에 저장한다."""
+    digest = file_sha256(path)
+    cache_file = os.path.join(cache_dir, f"{digest}.json") if cache_dir else None
+    if cache_file and os.path.exists(cache_file):
+        with open(cache_file) as f:
+            data = json.load(f)
+        if data.get("version") == INDEX_VERSION:
+            return SopcIndex(data)
+
+    data = build_index(path)
+    data["sha256"] = digest
+    if cache_file:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = cache_file + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, cache_file) # 병렬 실행 시에도 깨진 캐시가 보이지 않도록
+    return SopcIndex(data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print an index of a Platform Designer .sopcinfo file")
+    parser.add_argument("sopcinfo", nargs="?", default=DEFAULT_SOPCINFO)
+    parser.add_argument("--module", help="Print full details of one module instance")
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args(argv)
+
+    index = load_index(args.sopcinfo, None if args.no_cache else DEFAULT_CACHE_DIR)
+    if args.module:
+        json.dump(index.modules[args.module], sys.stdout, indent=2)
+        print()
+        return 0
+
+    print("Clocks:")
+    for name, hz in sorted(index.clocks.items()):
+        print(f"  {name:40s} {hz / 1e6:8.2f} MHz")
+    print("HDL top-levels:")
+    for kind, top in sorted(index.data["hdl_toplevels"].items()):
+        print(f"  {kind:40s} -> {top} ({', '.join(index.instances_of(top)) or 'not instantiated'})")
+    print("Address maps:")
+    for name, module in sorted(index.modules.items()):
+        for iname, itf in module["interfaces"].items():
+            for block in itf.get("address_map", []):
+                print(f"  {name}.{iname:20s} 0x{block['base']:08X} +0x{block['span']:X} {block['slave']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+SW vs HW Speedup 벤치마크 리포트
+
+main.c 의 보드 측정(">85x speedup")을 시뮬레이션으로 재현한다.
+tb_speedup.py 가 각 DUT에서 측정한 HW 사이클(speedup.json)을 모아,
+Nios II 소프트웨어 루프의 CPU 비용 모델과 비교하여 Speedup 표와 차트를 만든다.
+
+CPU 비용 모델은 sopcinfo의 Nios II 구성(impl, multiplierType, dividerType)으로
+프리셋을 고르고, CPU_COST_MODEL 환경 변수(JSON)로 항목별 사이클을 덮어쓸 수 있다.
+    CPU_COST_MODEL='{"div": 450, "mul": 180}' pytest test_runner.py
+
+사용 예:
+    python speedup.py sim_build/          # 표 출력 + sim_build/speedup/ 에 차트 생성
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+except ImportError:  # 차트는 선택 사항 (표는 항상 생성)
+    plt = None
+
+RECORD_NAME = "speedup.json"
+
+# 소프트웨어 루프 1회(원소 1개)에 드는 연산별 CPU 사이클
+#   loop     : 인덱스 증가/비교/분기
+#   load     : src_data[i] 읽기
+#   store_io : IOWR(DEST_ADDR_BASE, i, ...) (Avalon 버스 쓰기)
+#   mul/div  : 32-bit 곱셈/나눗셈 (HW 곱셈기가 없으면 libgcc 에뮬레이션)
+CPU_COST_PRESETS = {
+    # Nios II/e: 파이프라인 없음 (~6 CPI), 곱셈/나눗셈은 소프트웨어 루틴
+    "Tiny": {"loop": 18, "load": 12, "store_io": 14, "mul": 220, "div": 650},
+    # Nios II/f: 6단 파이프라인, HW 곱셈기 + SRT 나눗셈기
+    "Fast": {"loop": 3, "load": 2, "store_io": 4, "mul": 1, "div": 35},
+}
+
+# 워크로드별 원소당 소프트웨어 연산 구성 (main.c 루프와 동일)
+SW_KERNELS = {
+    "copy":     ("loop", "load", "store_io"),                # compare_transfer_speed(): CPU copy
+    "mult_div": ("loop", "load", "mul", "div", "store_io"),  # (input * coeff_a) / 400
+}
+
+
+def cpu_cost_model(sopc=None, cpu="nios2_gen2_0"):
+    """sopcinfo의 Nios II 구성으로 프리셋을 고르고 CPU_COST_MODEL 로 덮어쓴다."""
+    preset = "Tiny"
+    if sopc is not None and cpu in sopc.modules:
+        params = sopc.modules[cpu]["params"]
+        preset = params.get("impl", preset)
+        model = dict(CPU_COST_PRESETS.get(preset, CPU_COST_PRESETS["Tiny"]))
+        if preset == "Fast" and params.get("multiplierType") == "no_mul":
+            model["mul"] = CPU_COST_PRESETS["Tiny"]["mul"]
+    else:
+        model = dict(CPU_COST_PRESETS[preset])
+    model.update(json.loads(os.environ.get("CPU_COST_MODEL", "{}")))
+    model["preset"] = preset
+    return model
+
+
+def sw_cycles(kernel, elements, model):
+    return elements * sum(model[op] for op in SW_KERNELS[kernel])
+
+
+def load_records(sim_build_root):
+    """sim_build/*/speedup.json 을 모두 읽는다."""
+    records = []
+    for root, _, files in os.walk(sim_build_root):
+        if RECORD_NAME in files:
+            with open(os.path.join(root, RECORD_NAME)) as f:
+                records += json.load(f)
+    return sorted(records, key=lambda r: (r["workload"], r["dut"]))
+
+
+def build_table(records, model):
+    rows = []
+    for r in records:
+        sw = sw_cycles(r["kernel"], r["elements"], model)
+        rows.append({
+            "workload": r["workload"],
+            "dut": r["dut"],
+            "elements": r["elements"],
+            "hw_cycles": r["hw_cycles"],
+            "sw_cycles": sw,
+            "speedup": sw / r["hw_cycles"] if r["hw_cycles"] else 0.0,
+        })
+    return rows
+
+
+def format_table(rows, model):
+    lines = [
+        f"CPU cost model ({model['preset']}): "
+        + ", ".join(f"{op}={model[op]}" for op in ("loop", "load", "store_io", "mul", "div")),
+        "",
+        "| Workload | DUT | Elements | HW Cycles | SW Cycles | Speedup |",
+        "|----------|-----|----------|-----------|-----------|---------|",
+    ]
+    for r in rows:
+        lines.append(f"| {r['workload']} | {r['dut']} | {r['elements']} | {r['hw_cycles']} | "
+                     f"{r['sw_cycles']} | **{r['speedup']:.2f}x** |")
+    return "\n".join(lines)
+
+
+def write_chart(rows, path):
+    """Speedup 막대 차트 (matplotlib 이 없으면 None)"""
+    if plt is None or not rows:
+        return None
+    labels = [f"{r['workload']}\n({r['dut']})" for r in rows]
+    speedups = [r["speedup"] for r in rows]
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    bars = ax.bar(labels, speedups, color="#3b7dd8")
+    ax.bar_label(bars, labels=[f"{s:.1f}x" for s in speedups])
+    ax.set_ylabel("Speedup vs. Nios II software (x)")
+    ax.set_title("SW vs HW Speedup (simulated)")
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return path
+
+
+def report(sim_build_root, sopc=None, out_dir=None):
+    """표(speedup.md)와 차트(performance_chart.png)를 생성하고 행 목록을 반환한다."""
+    model = cpu_cost_model(sopc)
+    rows = build_table(load_records(sim_build_root), model)
+    out_dir = out_dir or os.path.join(sim_build_root, "speedup")
+    os.makedirs(out_dir, exist_ok=True)
+    table = format_table(rows, model)
+    with open(os.path.join(out_dir, "speedup.md"), "w") as f:
+        f.write(table + "\n")
+    chart = write_chart(rows, os.environ.get("SPEEDUP_CHART", os.path.join(out_dir, "performance_chart.png")))
+    print(table)
+    if chart:
+        print(f"\nChart: {chart}")
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the SW vs HW speedup table from simulation results")
+    parser.add_argument("sim_build", nargs="?", default="sim_build")
+    parser.add_argument("--out", help="Output directory (default: <sim_build>/speedup)")
+    args = parser.parse_args(argv)
+
+    import sopc_index
+    report(args.sim_build, sopc_index.load_index(), args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
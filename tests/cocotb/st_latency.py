@@ -0,0 +1,131 @@
+import random
+from collections import deque
+
+import cocotb
+from cocotb.triggers import RisingEdge
+
+
+# aso_ready 백프레셔 프로파일: cycle 번호를 받아 해당 사이클의 ready 값을 반환
+BACKPRESSURE_PROFILES = {
+    "none":       lambda cycle: True,                    # 항상 Ready (최대 Throughput)
+    "random_10":  lambda cycle: random.random() >= 0.1,  # 10% 확률로 Stall
+    "random_50":  lambda cycle: random.random() >= 0.5,  # 50% 확률로 Stall
+    "periodic_4": lambda cycle: (cycle % 8) < 4,         # 4사이클 Ready / 4사이클 Stall
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank 방식의 백분위수 (sorted_values는 오름차순 정렬되어 있어야 함)"""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-pct * len(sorted_values) // 100))  # ceil(pct/100 * N)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LatencyStats:
+    """Ingress -> Egress 지연 분포와 Stall 통계"""
+
+    def __init__(self, label):
+        self.label = label
+        self.latencies = []
+        self.cycles = 0
+        self.stall_cycles = 0    # aso_valid=1 인데 aso_ready=0 (출력단이 막힌 사이클)
+        self.blocked_cycles = 0  # asi_valid=1 인데 asi_ready=0 (입력이 거부된 사이클)
+
+    def summary(self):
+        values = sorted(self.latencies)
+        return {
+            "items": len(values),
+            "cycles": self.cycles,
+            "min": values[0] if values else 0,
+            "p50": percentile(values, 50),
+            "p99": percentile(values, 99),
+            "max": values[-1] if values else 0,
+            "stall_cycles": self.stall_cycles,
+            "blocked_cycles": self.blocked_cycles,
+            "throughput": len(values) / self.cycles if self.cycles else 0.0,
+        }
+
+    def report(self, log):
+        s = self.summary()
+        log.info(f"[{self.label}] items={s['items']} latency min/p50/p99/max = "
+                 f"{s['min']}/{s['p50']}/{s['p99']}/{s['max']} cycles, "
+                 f"stall={s['stall_cycles']}, blocked={s['blocked_cycles']}, "
+                 f"throughput={s['throughput']:.3f} items/cycle")
+
+
+class StLatencyMonitor:
+    """Avalon-ST Sink/Source 핸드셰이크를 관찰하여 항목별 지연을 측정한다.
+
+    입력 beat(asi_valid && asi_ready)가 수락된 사이클을 큐에 넣고,
+    출력 beat(aso_valid && aso_ready)가 나갈 때 순서대로 꺼내 지연을 계산한다.
+    (파이프라인은 순서를 바꾸지 않으므로 FIFO 매칭으로 충분)
+    """
+
+    def __init__(self, dut, label, clk=None):
+        self.dut = dut
+        self.clk = clk if clk is not None else dut.clk
+        self.stats = LatencyStats(label)
+        self.pending = deque()
+        self.cycle = 0
+        self._task = None
+
+    def start(self):
+        self._task = cocotb.start_soon(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
+
+    async def _run(self):
+        dut = self.dut
+        while True:
+            await RisingEdge(self.clk)
+            self.cycle += 1
+            self.stats.cycles += 1
+
+            in_valid = dut.asi_valid.value == 1
+            in_ready = dut.asi_ready.value == 1
+            out_valid = dut.aso_valid.value == 1
+            out_ready = dut.aso_ready.value == 1
+
+            if in_valid and in_ready:
+                self.pending.append(self.cycle)
+            elif in_valid:
+                self.stats.blocked_cycles += 1
+
+            if out_valid and out_ready:
+                if not self.pending:
+                    raise AssertionError(f"[{self.stats.label}] Output beat without matching input beat")
+                self.stats.latencies.append(self.cycle - self.pending.popleft())
+            elif out_valid:
+                self.stats.stall_cycles += 1
+
+
+async def drive_stream(dut, items, data_width=32):
+    """asi 포트로 items개의 beat를 연속해서 전송한다 (asi_ready로 흐름 제어)
+
+    Avalon-ST 규격에 따라 beat가 수락될 때까지(asi_ready) asi_data를 유지하고,
+    수락된 다음에만 새 데이터를 만든다.
+    """
+    mask = (1 << data_width) - 1
+    sent = 0
+    dut.asi_valid.value = 1 if items else 0
+    dut.asi_data.value = random.getrandbits(data_width) & mask
+    while sent < items:
+        await RisingEdge(dut.clk)
+        if dut.asi_ready.value == 1:
+            sent += 1
+            if sent < items:
+                dut.asi_data.value = random.getrandbits(data_width) & mask
+    dut.asi_valid.value = 0
+
+
+async def drive_backpressure(dut, profile):
+    """aso_ready를 프로파일에 따라 매 사이클 구동한다"""
+    cycle = 0
+    while True:
+        dut.aso_ready.value = 1 if profile(cycle) else 0
+        await RisingEdge(dut.clk)
+        cycle += 1
@@ -0,0 +1,226 @@
+"""
+파라미터 스윕 (FIFO 깊이 / 데이터 폭 / 파이프라인 단수 vs Throughput)
+
+파라미터 그리드의 각 점을 Icarus 파라미터 오버라이드(-P)로 빌드하고, Throughput 테스트벤치를
+병렬로 실행하여 파라미터별 Throughput 표를 만든다. Quartus 컴파일 전에 FIFO/M10K 사용량과
+대역폭을 저울질하는 용도.
+
+빌드 디렉토리는 (toplevel, 파라미터, 소스 파일 내용) 해시로 정해지는 content-addressed 캐시이다.
+같은 파라미터/소스 조합은 이전 빌드(<toplevel>.vvp)를 그대로 재사용하고, 다른 조합이 같은 디렉토리를
+덮어쓰는 일이 없다 (cocotb-test는 파일 mtime만 보고 재컴파일 여부를 판단하므로 필요).
+
+사용 예:
+    python sweep.py simple_fifo                               # 기본 그리드
+    python sweep.py simple_fifo --grid FIFO_DEPTH=16,64,256 --grid DATA_WIDTH=32 -j 4
+    SWEEP=simple_fifo,pipe_template pytest test_runner.py -k sweep
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import wave_capture
+
+PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+RECORD_NAME = "throughput.json"
+
+# toplevel -> (테스트벤치 모듈, 소스, 기본 그리드)
+#   pipe_template 은 Stage 0~2 만 명시적으로 구현되어 있어 STAGES <= 3 만 유효
+#   stream_processor_simd 는 Stage 0~2 와 128-bit 포트가 고정이라 STAGES=3, LANES <= 4 만 유효
+SWEEPS = {
+    "simple_fifo": {
+        "module": "tb_fifo_throughput",
+        "sources": [os.path.join(PROJ_PATH, "RTL", "simple_fifo.v")],
+        "grid": {"FIFO_DEPTH": [16, 64, 256, 512, 1024], "DATA_WIDTH": [32, 64]},
+    },
+    "pipe_template": {
+        "module": "tb_stream_latency",
+        "sources": [os.path.join(PROJ_PATH, "RTL", "pipe_template.v")],
+        "grid": {"STAGES": [1, 2, 3], "DATA_WIDTH": [32, 64, 128]},
+    },
+    "stream_processor_simd": {
+        "module": "tb_stream_latency",
+        "sources": [os.path.join(PROJ_PATH, "RTL", "stream_processor_simd.v")],
+        "grid": {"LANES": [1, 2, 4], "STAGES": [3]},
+    },
+}
+
+# Cyclone V M10K 구성 (depth x width)
+M10K_CONFIGS = ((256, 40), (512, 20), (1024, 10), (2048, 5), (4096, 2), (8192, 1))
+
+
+def write_record(records, sim_build=None):
+    """테스트벤치가 측정 결과를 $SIM_BUILD/throughput.json 에 기록 (스윕이 집계)"""
+    path = os.path.join(sim_build or os.environ.get("SIM_BUILD", os.getcwd()), RECORD_NAME)
+    with open(path, "w") as f:
+        json.dump(records, f, indent=2)
+    return path
+
+
+def parse_grid(items):
+    """['FIFO_DEPTH=16,64', 'DATA_WIDTH=32'] -> {'FIFO_DEPTH': [16, 64], 'DATA_WIDTH': [32]}"""
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if not values:
+            raise ValueError(f"Invalid grid entry '{item}' (expected NAME=v1,v2,...)")
+        grid[name.strip()] = [int(v, 0) for v in values.split(",")]
+    return grid
+
+
+def expand_grid(grid):
+    """그리드의 모든 조합 (파라미터 이름 순서 유지)"""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+def build_key(toplevel, module, params, sources):
+    """(toplevel, 테스트벤치, 파라미터, 소스 내용) 의 SHA-256"""
+    h = hashlib.sha256()
+    h.update(json.dumps([toplevel, module, sorted(params.items())]).encode())
+    for src in sources:
+        with open(src, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def point_dir(root, toplevel, module, params, sources):
+    return os.path.join(root, "sweep", toplevel, build_key(toplevel, module, params, sources)[:16])
+
+
+def m10k_blocks(depth, width):
+    return min(math.ceil(depth / d) * math.ceil(width / w) for d, w in M10K_CONFIGS)
+
+
+def resources(toplevel, params):
+    """파라미터별 대략적인 자원 추정 (Quartus 결과가 아님)"""
+    if toplevel == "simple_fifo":
+        depth, width = params.get("FIFO_DEPTH", 512), params.get("DATA_WIDTH", 32)
+        # rd_data 가 비동기 읽기(FWFT)라 실제로는 MLAB/레지스터로 추론될 수 있음
+        return f"{depth * width} bits ({m10k_blocks(depth, width)} M10K)"
+    if toplevel == "pipe_template":
+        return f"{params.get('STAGES', 3) * (params.get('DATA_WIDTH', 32) + 1)} FF"
+    if toplevel == "stream_processor_simd":
+        stages, lanes = params.get("STAGES", 3), params.get("LANES", 4)
+        return f"{lanes * (stages * 32 + 128) + stages} FF, {lanes} mult"
+    return ""
+
+
+def run_point(toplevel, module, sources, params, sim_build, extra_env=None):
+    """스윕 한 점을 빌드/실행 (ProcessPoolExecutor 워커에서 호출)"""
+    from cocotb_test.simulator import run
+
+    os.makedirs(sim_build, exist_ok=True)
+    with open(os.path.join(sim_build, "params.json"), "w") as f:
+        json.dump({"toplevel": toplevel, "module": module, "params": params}, f, indent=2)
+    record = os.path.join(sim_build, RECORD_NAME)
+    if os.path.exists(record):
+        os.remove(record) # 이전 실행 결과와 섞이지 않도록
+    try:
+        with wave_capture.hide_waves_env():
+            run(
+                extra_env=dict(extra_env or {}, SIM_BUILD=os.path.abspath(sim_build)),
+                verilog_sources=sources,
+                toplevel=toplevel,
+                module=module,
+                simulator="icarus",
+                waves=False, # 스윕은 파형 없이 실행 (WAVES 는 test_runner 형식이라 위에서 숨김)
+                parameters=params, # Icarus: -P <toplevel>.<NAME>=<value>
+                sim_build=sim_build, # content-addressed: 같은 조합이면 <toplevel>.vvp 재사용
+            )
+        status, reason = "PASS", ""
+    except (SystemExit, Exception) as e: # cocotb-test는 실패 시 SystemExit 를 던짐 (Ctrl-C는 그대로 전파)
+        status, reason = "FAIL", str(e).splitlines()[0] if str(e) else type(e).__name__
+    records = []
+    if os.path.exists(record):
+        with open(record) as f:
+            records = json.load(f)
+    return {"toplevel": toplevel, "params": params, "status": status, "reason": reason,
+            "sim_build": sim_build, "records": records}
+
+
+def run_sweep(toplevel, grid=None, root="sim_build", jobs=None, extra_env=None):
+    """그리드의 모든 점을 병렬로 실행하고 점별 결과 목록을 (그리드 순서대로) 반환한다."""
+    spec = SWEEPS[toplevel]
+    points = expand_grid(grid or spec["grid"])
+    args = [
+        (toplevel, spec["module"], spec["sources"], params,
+         point_dir(root, toplevel, spec["module"], params, spec["sources"]), extra_env)
+        for params in points
+    ]
+    jobs = jobs or min(len(args), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_point, *a) for a in args]
+        return [f.result() for f in futures]
+
+
+def build_table(results):
+    rows = []
+    for r in results:
+        if not r["records"]:
+            rows.append(dict(r["params"], status=r["status"], profile="-", items_per_cycle=0.0,
+                             mb_per_s=0.0, p99="-", resources=resources(r["toplevel"], r["params"])))
+            continue
+        for rec in r["records"]:
+            rows.append(dict(r["params"], status=r["status"], profile=rec["profile"],
+                             items_per_cycle=rec["items_per_cycle"], mb_per_s=rec["mb_per_s"],
+                             p99=rec.get("p99", "-"), resources=resources(r["toplevel"], r["params"])))
+    return rows
+
+
+def format_table(toplevel, results):
+    names = list(results[0]["params"]) if results else []
+    header = names + ["profile", "items/cycle", "MB/s", "p99 lat", "resources (est.)", "status"]
+    lines = [
+        f"Parameter sweep: {toplevel}",
+        "",
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("-" * (len(h) + 2) for h in header) + "|",
+    ]
+    for row in build_table(results):
+        cells = [str(row[n]) for n in names] + [
+            row["profile"], f"{row['items_per_cycle']:.3f}", f"{row['mb_per_s']:.1f}",
+            str(row["p99"]), row["resources"], row["status"],
+        ]
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+
+def report(toplevel, results, root="sim_build"):
+    """표를 출력하고 sim_build/sweep/<toplevel>/sweep.md 에 저장한다."""
+    table = format_table(toplevel, results)
+    out_dir = os.path.join(root, "sweep", toplevel)
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "sweep.md"), "w") as f:
+        f.write(table + "\n")
+    print(table)
+    for r in results:
+        if r["status"] != "PASS":
+            print(f"FAIL {r['params']}: {r['reason']} ({r['sim_build']})")
+    return table
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep RTL parameters and tabulate throughput")
+    parser.add_argument("toplevel", choices=sorted(SWEEPS))
+    parser.add_argument("--grid", action="append", default=[], metavar="NAME=V1,V2",
+                        help="Override the default grid (repeatable)")
+    parser.add_argument("-j", "--jobs", type=int, help="Parallel simulations (default: CPU count)")
+    parser.add_argument("--root", default="sim_build")
+    args = parser.parse_args(argv)
+
+    import sopc_index
+    sopc = sopc_index.load_index()
+    extra_env = {"CLOCK_PERIOD_NS": str(sopc.clock_period_ns(args.toplevel))}
+    grid = parse_grid(args.grid) or None
+    results = run_sweep(args.toplevel, grid, args.root, args.jobs, extra_env)
+    report(args.toplevel, results, args.root)
+    return 0 if all(r["status"] == "PASS" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
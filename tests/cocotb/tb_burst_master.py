@@ -2,15 +2,46 @@ import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import RisingEdge, Timer
 from cocotb.queue import Queue
+from cocotb.utils import get_sim_time
+from collections import namedtuple
+import json
+import os
 import random
+from fifo_monitor import FifoMonitor
+from sopc_index import env_clock_period_ns, mb_per_s
+
+CLOCK_PERIOD_NS = env_clock_period_ns()
+# DMA 소스(onchip_memory2_0)/목적지(mmio_0) base address (sopcinfo 주소 맵)
+DMA_SRC_BASE = int(os.environ.get("DMA_SRC_BASE", "0x80000"), 0)
+DMA_DST_BASE = int(os.environ.get("DMA_DST_BASE", "0xC0000"), 0)
 
 class AvalonMemory:
-    def __init__(self, dut, name, size=1024*1024):
+    def __init__(self, dut, name, size=1024*1024, verbose=True):
         self.dut = dut
         self.name = name
         self.mem = {} # Sparse memory map
         self.size = size
         self.log = dut._log
+        self.verbose = verbose     # False: Burst 단위 로그 생략 (Soak 등 장시간 실행)
+        self.read_wait_prob = 0.1  # rm_waitrequest 확률 (Backpressure)
+        self.write_wait_prob = 0.0 # wm_waitrequest 확률 (Backpressure)
+        self.epoch = 0             # flush() 마다 증가 (진행 중인 Burst 중단)
+
+    def flush(self):
+        """대기 중인 Read 명령과 진행 중인 Read/Write Burst 상태를 버린다 (DUT 리셋 시 사용)"""
+        self.epoch += 1
+        queue = getattr(self, "read_cmd_queue", None)
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+        self.dut.rm_readdatavalid.value = 0
+
+    def read_word(self, addr):
+        """Read Data 소스 (Soak에서는 생성기 기반으로 override)"""
+        return self.mem.get(addr, 0)
+
+    def write_word(self, addr, data):
+        """Write 수신 처리 (Soak에서는 저장 대신 즉시 비교하도록 override)"""
+        self.mem[addr] = data
 
     def start_read_monitor(self):
         self.read_cmd_queue = Queue()
@@ -22,7 +53,7 @@ class AvalonMemory:
         while True:
             await RisingEdge(self.dut.clk)
             
-            if random.random() < 0.1:
+            if random.random() < self.read_wait_prob:
                 self.dut.rm_waitrequest.value = 1
             else:
                 self.dut.rm_waitrequest.value = 0
@@ -30,7 +61,8 @@ class AvalonMemory:
             if self.dut.rm_read.value == 1 and self.dut.rm_waitrequest.value == 0:
                 addr = int(self.dut.rm_address.value)
                 burst = int(self.dut.rm_burstcount.value)
-                self.log.info(f"[{self.name}] Read Request Accepted: Addr=0x{addr:X}, Burst={burst}")
+                if self.verbose:
+                    self.log.info(f"[{self.name}] Read Request Accepted: Addr=0x{addr:X}, Burst={burst}")
                 self.read_cmd_queue.put_nowait((addr, burst))
 
 
@@ -42,13 +74,17 @@ class AvalonMemory:
         while True:
             cmd = await self.read_cmd_queue.get()
             addr, burst = cmd
+            epoch = self.epoch
             
-            self.log.info(f"[{self.name}] Data Driver: Starting burst Addr=0x{addr:X} Len={burst}")
+            if self.verbose:
+                self.log.info(f"[{self.name}] Data Driver: Starting burst Addr=0x{addr:X} Len={burst}")
             
             for i in range(burst):
                 await RisingEdge(self.dut.clk)
+                if self.epoch != epoch: # flush() 됨 -> 남은 beat 버림
+                    break
                 self.dut.rm_readdatavalid.value = 1
-                data = self.mem.get(addr + (i*4), 0)
+                data = self.read_word(addr + (i*4))
                 self.dut.rm_readdata.value = data
             
             await RisingEdge(self.dut.clk)
@@ -59,12 +95,19 @@ class AvalonMemory:
         """Monitors Write Master Interface"""
         burst_cnt = 0
         active_addr = 0
+        epoch = self.epoch
         
         while True:
             await RisingEdge(self.dut.clk)
+            if self.epoch != epoch: # flush() 됨 -> 진행 중이던 Write Burst 상태 초기화
+                epoch = self.epoch
+                burst_cnt = 0
             
-            # Simple Accept
-            self.dut.wm_waitrequest.value = 0
+            # Simple Accept (write_wait_prob > 0 이면 랜덤 Backpressure)
+            if self.write_wait_prob and random.random() < self.write_wait_prob:
+                self.dut.wm_waitrequest.value = 1
+            else:
+                self.dut.wm_waitrequest.value = 0
             
             if self.dut.wm_write.value == 1 and self.dut.wm_waitrequest.value == 0:
                 addr = int(self.dut.wm_address.value)
@@ -73,10 +116,11 @@ class AvalonMemory:
                 if burst_cnt == 0:
                     active_addr = addr
                     burst_len = int(self.dut.wm_burstcount.value)
-                    self.log.info(f"[{self.name}] Write Start: Addr=0x{addr:X}, Len={burst_len}")
+                    if self.verbose:
+                        self.log.info(f"[{self.name}] Write Start: Addr=0x{addr:X}, Len={burst_len}")
                 
                 effective_addr = active_addr + (burst_cnt * 4)
-                self.mem[effective_addr] = data
+                self.write_word(effective_addr, data)
                 
                 burst_cnt += 1
                 if burst_cnt >= int(self.dut.wm_burstcount.value):
@@ -91,7 +135,7 @@ async def test_burst_master_basic(dut):
         return
     
     # 1. Setup Clock
-    clock = Clock(dut.clk, 10, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # 2. Reset
@@ -146,6 +190,8 @@ async def test_burst_master_basic(dut):
     # Start Monitors
     mem_model.start_read_monitor()
     cocotb.start_soon(mem_model.write_monitor())
+    fifo_mon = FifoMonitor(dut)
+    fifo_mon.start()
     
     # 4. Start Transaction via CSR
     dut._log.info("Configuring CSR Registers...")
@@ -169,6 +215,8 @@ async def test_burst_master_basic(dut):
             raise AssertionError("Timeout waiting for Done Status")
             
     dut._log.info("Transaction Done! (Status Bit Set)")
+    fifo_mon.stop()
+    fifo_mon.report("test_burst_master_basic")
     await write_csr(1, 1) # Write 1 to clear
     
     # 6. Verify Memory
@@ -191,7 +239,7 @@ async def test_burst_master_4_pipeline(dut):
         # Skip if not burst_master_4
         return
 
-    clock = Clock(dut.clk, 10, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # Reset
@@ -296,6 +344,8 @@ async def test_burst_master_4_pipeline(dut):
     mem_model = AvalonMemory(dut, "mem_model")
     mem_model.start_read_monitor()
     cocotb.start_soon(mem_model.write_monitor())
+    fifo_mon = FifoMonitor(dut)
+    fifo_mon.start()
 
     # Setup Data
     expected_data = []
@@ -327,6 +377,9 @@ async def test_burst_master_4_pipeline(dut):
     else:
         raise AssertionError("Timeout")
 
+    fifo_mon.stop()
+    fifo_mon.report("test_burst_master_4_pipeline")
+
     # Verify
     for i in range(0, TOTAL_BYTES, 4):
         addr = DST_ADDR + i
@@ -350,7 +403,7 @@ async def test_programmable_burst(dut):
         # But wait, I only modified burst_master.v!
         return
 
-    clock = Clock(dut.clk, 10, units="ns")
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
     cocotb.start_soon(clock.start())
     
     # Reset
@@ -363,6 +416,8 @@ async def test_programmable_burst(dut):
     mem_model = AvalonMemory(dut, "MEM_PROG")
     mem_model.start_read_monitor()
     cocotb.start_soon(mem_model.write_monitor())
+    fifo_mon = FifoMonitor(dut)
+    fifo_mon.start()
 
     # CSR Helper Functions
     async def write_csr(address, data):
@@ -441,6 +496,8 @@ async def test_programmable_burst(dut):
             raise AssertionError("Timeout waiting for Done Status")
 
     dut._log.info("Transaction Done!")
+    fifo_mon.stop()
+    fifo_mon.report("test_programmable_burst")
     
     # Verify Data
     for i in range(0, TOTAL_BYTES, 4):
@@ -452,3 +509,195 @@ async def test_programmable_burst(dut):
             raise AssertionError(f"Data Mismatch at {hex(addr)}: Expected {hex(expected)}, Got {hex(read_val)}")
 
     dut._log.info("Programmable Burst Verification Complete!")
+
+
+# =============================================================================
+# Scenario Table: 여러 전송 설정을 하나의 시뮬레이션(1회 elaboration)에서 연속 실행
+# =============================================================================
+
+Scenario = namedtuple("Scenario", "name src dst length rd_burst wr_burst coeff profile reset")
+Scenario.__new__.__defaults__ = (256, 256, 1, "none", False)
+
+# (rm_waitrequest 확률, wm_waitrequest 확률)
+MM_BACKPRESSURE_PROFILES = {
+    "none":  (0.0, 0.0),
+    "light": (0.1, 0.0),
+    "heavy": (0.3, 0.3),
+}
+
+# DUT별 지원 기능 (burst_master_2는 Burst 길이가 BURST_COUNT로 고정, 패딩 없음)
+DUT_CAPS = {
+    "burst_master":   {"prog_burst": True,  "coeff": False},
+    "burst_master_2": {"prog_burst": False, "coeff": False},
+    "burst_master_4": {"prog_burst": True,  "coeff": True},
+}
+
+SCENARIOS = [
+    Scenario("copy_2k",         0x1000,  0x5000,  2048),
+    Scenario("copy_2k_light",   0x1000,  0x9000,  2048, profile="light"),
+    Scenario("copy_4k_heavy",   0x10000, 0x20000, 4096, profile="heavy"),
+    Scenario("rd64_wr32",       0x8000,  0xC000,  512,  64, 32),
+    Scenario("rd32_wr64_pad",   0x8000,  0xD000,  508,  32, 64, profile="light"),
+    Scenario("rd16_wr16",       0x3000,  0x7000,  1024, 16, 16, coeff=3),
+    Scenario("coeff7_heavy",    0x4000,  0xA000,  1024, 64, 64, coeff=7, profile="heavy"),
+    Scenario("after_reset",     0x1000,  0x6000,  1024, 128, 128, coeff=5, reset=True),
+    Scenario("system_map",      DMA_SRC_BASE, DMA_DST_BASE, 1024), # main.c DATA_SIZE=256 words
+]
+
+
+def load_scenarios():
+    """SCENARIO_FILE 환경 변수가 있으면 JSON 리스트에서 시나리오를 읽는다."""
+    path = os.environ.get("SCENARIO_FILE")
+    if not path:
+        return SCENARIOS
+    with open(path) as f:
+        return [Scenario(**entry) for entry in json.load(f)]
+
+
+def expected_word(dut_name, val, coeff):
+    """DUT별 기대 출력 (BM4: * coeff 후 /400 근사)"""
+    if dut_name == "burst_master_4":
+        intermediate = (val * coeff) & 0xFFFFFFFF
+        return ((intermediate * 5243) >> 21) & 0xFFFFFFFF
+    return val
+
+
+async def write_csr(dut, address, data):
+    """Write to Avalon-MM CSR Slave"""
+    await RisingEdge(dut.clk)
+    dut.avs_address.value = address
+    dut.avs_write.value = 1
+    dut.avs_writedata.value = data
+    await RisingEdge(dut.clk)
+    dut.avs_write.value = 0
+    dut.avs_address.value = 0
+
+
+async def read_csr(dut, address):
+    """Read from Avalon-MM CSR Slave"""
+    await RisingEdge(dut.clk)
+    dut.avs_address.value = address
+    dut.avs_read.value = 1
+    await RisingEdge(dut.clk)
+    val = dut.avs_readdata.value
+    dut.avs_read.value = 0
+    return val
+
+
+async def reset_burst_master(dut):
+    dut.reset_n.value = 0
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+    dut.reset_n.value = 1
+    await RisingEdge(dut.clk)
+
+
+async def run_scenario(dut, mem_model, sc, clock_period_ns=CLOCK_PERIOD_NS):
+    """시나리오 1개 실행 (CSR로 Re-arm). 결과 dict 반환"""
+    caps = DUT_CAPS[dut._name]
+    if not caps["prog_burst"] and (sc.rd_burst != 256 or sc.wr_burst != 256 or sc.length % 1024):
+        return {"name": sc.name, "status": "SKIP", "reason": "fixed burst length"}
+    coeff = sc.coeff if caps["coeff"] else 1
+
+    if sc.reset:
+        await reset_burst_master(dut)
+
+    rd_wait, wr_wait = MM_BACKPRESSURE_PROFILES[sc.profile]
+    mem_model.read_wait_prob = rd_wait
+    mem_model.write_wait_prob = wr_wait
+
+    # Read Burst 설정 후 Length를 써야 패딩이 올바르게 계산됨
+    if caps["prog_burst"]:
+        await write_csr(dut, 5, sc.rd_burst)
+        await write_csr(dut, 6, sc.wr_burst)
+    if caps["coeff"]:
+        await write_csr(dut, 7, coeff)
+    await write_csr(dut, 2, sc.src)
+    await write_csr(dut, 3, sc.dst)
+    await write_csr(dut, 4, sc.length)
+    eff_len = int(await read_csr(dut, 4))
+
+    expected = []
+    for i in range(0, eff_len, 4):
+        val = (sc.src + i) ^ 0x5A5A0000
+        mem_model.mem[sc.src + i] = val
+        mem_model.mem.pop(sc.dst + i, None) # 이전 시나리오의 결과 제거
+        expected.append(expected_word(dut._name, val, coeff))
+
+    start_ns = get_sim_time(unit="ns")
+    await write_csr(dut, 0, 1) # Start
+
+    timeout = (eff_len // 4) * 20 + 2000
+    while True:
+        await RisingEdge(dut.clk)
+        timeout -= 1
+        if timeout % 10 == 0:
+            status = await read_csr(dut, 1)
+            if (int(status) & 1) == 1:
+                break
+        if timeout <= 0:
+            # 멈춘 엔진/남은 Read 명령이 다음 시나리오로 이어지지 않도록 리셋
+            mem_model.flush()
+            await reset_burst_master(dut)
+            return {"name": sc.name, "status": "FAIL", "reason": "timeout"}
+    cycles = int((get_sim_time(unit="ns") - start_ns) // clock_period_ns)
+
+    await write_csr(dut, 1, 1) # Clear Done -> Re-arm
+
+    errors = 0
+    first_error = None
+    for i, exp in enumerate(expected):
+        got = mem_model.mem.get(sc.dst + i * 4, None)
+        if got != exp:
+            errors += 1
+            if first_error is None:
+                first_error = f"0x{sc.dst + i * 4:X}: Expected {exp}, Got {got}"
+    return {
+        "name": sc.name,
+        "status": "PASS" if errors == 0 else "FAIL",
+        "reason": first_error or "",
+        "bytes": eff_len,
+        "cycles": cycles,
+        "bytes_per_cycle": eff_len / cycles if cycles else 0.0,
+        "mb_per_s": mb_per_s(eff_len, cycles, clock_period_ns),
+    }
+
+
+@cocotb.test()
+async def test_scenario_table(dut):
+    """Run a table of transfer scenarios back-to-back in one simulation"""
+
+    if dut._name not in DUT_CAPS:
+        dut._log.info(f"Skipping scenario table for {dut._name}")
+        return
+
+    clock = Clock(dut.clk, CLOCK_PERIOD_NS, units="ns")
+    cocotb.start_soon(clock.start())
+
+    dut.avs_write.value = 0
+    dut.avs_read.value = 0
+    dut.avs_address.value = 0
+    dut.avs_writedata.value = 0
+    dut.rm_waitrequest.value = 1
+    dut.wm_waitrequest.value = 1
+    await reset_burst_master(dut)
+
+    mem_model = AvalonMemory(dut, "MEM_SCN")
+    mem_model.start_read_monitor()
+    cocotb.start_soon(mem_model.write_monitor())
+
+    results = []
+    for sc in load_scenarios():
+        result = await run_scenario(dut, mem_model, sc, CLOCK_PERIOD_NS)
+        results.append(result)
+        dut._log.info(f"[Scenario {sc.name}] {result['status']} {result.get('reason', '')}")
+
+    dut._log.info(f"{'scenario':>16} {'status':>6} {'bytes':>7} {'cycles':>7} {'B/cycle':>8} "
+                  f"{'MB/s @' + format(1000 / CLOCK_PERIOD_NS, '.0f') + 'MHz':>12}")
+    for r in results:
+        dut._log.info(f"{r['name']:>16} {r['status']:>6} {r.get('bytes', 0):>7} "
+                      f"{r.get('cycles', 0):>7} {r.get('bytes_per_cycle', 0.0):>8.3f} "
+                      f"{r.get('mb_per_s', 0.0):>12.1f}")
+
+    failed = [r["name"] for r in results if r["status"] == "FAIL"]
+    assert not failed, f"Failed scenarios: {', '.join(failed)}"
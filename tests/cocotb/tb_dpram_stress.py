@@ -0,0 +1,182 @@
+import os
+import random
+from collections import deque
+
+import cocotb
+import numpy as np
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+
+from sopc_index import env_clock_period_ns
+
+CLOCK_PERIOD_NS = env_clock_period_ns()
+
+WORDS = 256  # dpram: 256 x 32-bit
+STRESS_OPS = int(os.environ.get("DPRAM_STRESS_OPS", 20000))
+WRITE_PROB = 0.5
+RAW_PROB = 0.25  # 읽기 중 직전 사이클에 쓴 주소를 다시 읽는 비율 (read-after-write)
+RDW_PROB = float(os.environ.get("DPRAM_RDW_PROB", 0.05))  # read + write 동시 (같은 주소)
+
+# 읽기 종류별 기대값 규칙
+#   random   : 일반 읽기
+#   raw      : 직전 사이클에 쓴 주소 -> 새 데이터
+#   rdw      : 같은 사이클에 같은 주소 쓰기 -> 이전 데이터
+#              (read_during_write_mode_mixed_ports = "DONT_CARE": 실제 M10K에서는 보장되지 않으며,
+#               여기서는 altsyncram 시뮬레이션 모델의 old-data 동작을 확인한다)
+#   sweep    : 마지막 전체 읽기
+READ_KINDS = ("random", "raw", "rdw", "sweep")
+
+
+class ShadowMemory:
+    """NumPy 기반 dpram 그림자 메모리 + 읽기 응답 추적"""
+
+    def __init__(self, words=WORDS):
+        self.mem = np.zeros(words, dtype=np.uint32)
+        self.pending = deque()  # (issue_cycle, addr, expected, kind)
+        self.latencies = np.zeros(STRESS_OPS + 2 * words, dtype=np.int32)
+        self.reads = 0
+        self.writes = 0
+        self.errors = {kind: 0 for kind in READ_KINDS}
+        self.checked = {kind: 0 for kind in READ_KINDS}
+        self.first_error = None
+        self.readback = np.zeros(words, dtype=np.uint32)
+
+    def issue(self, cycle, cmd):
+        """DUT가 이 사이클 Edge에서 샘플링한 명령을 반영 (읽기 기대값은 쓰기 반영 전 값)"""
+        if cmd["read"]:
+            addr = cmd["addr"]
+            self.pending.append((cycle, addr, int(self.mem[addr]), cmd["kind"]))
+        if cmd["write"]:
+            self.mem[cmd["addr"]] = cmd["data"]
+            self.writes += 1
+
+    def respond(self, cycle, data):
+        """readdatavalid 응답을 가장 오래된 읽기와 매칭 (Avalon 읽기 응답은 순서 보장)"""
+        if not self.pending:
+            raise AssertionError(f"readdatavalid at cycle {cycle} without an outstanding read")
+        issued, addr, expected, kind = self.pending.popleft()
+        self.latencies[self.reads] = cycle - issued
+        self.reads += 1
+        self.checked[kind] += 1
+        if kind == "sweep":
+            self.readback[addr] = data
+        if data != expected:
+            self.errors[kind] += 1
+            if self.first_error is None:
+                self.first_error = (f"cycle {issued} {kind} read @0x{addr:02X}: "
+                                    f"Expected 0x{expected:08X}, Got 0x{data:08X}")
+
+    def latency_summary(self):
+        lat = self.latencies[:self.reads]
+        if not lat.size:
+            return {"min": 0, "mean": 0.0, "p99": 0, "max": 0}
+        return {
+            "min": int(lat.min()),
+            "mean": float(lat.mean()),
+            "p99": int(np.percentile(lat, 99, method="higher")),
+            "max": int(lat.max()),
+        }
+
+
+def random_command(last_write_addr):
+    """매 사이클 하나의 명령 (쓰기 / 읽기 / 같은 주소 read+write)"""
+    r = random.random()
+    if r < RDW_PROB:
+        addr = random.randrange(WORDS)
+        return {"read": 1, "write": 1, "addr": addr, "data": random.getrandbits(32), "kind": "rdw"}
+    if r < RDW_PROB + WRITE_PROB:
+        return {"read": 0, "write": 1, "addr": random.randrange(WORDS), "data": random.getrandbits(32)}
+    if last_write_addr is not None and random.random() < RAW_PROB:
+        return {"read": 1, "write": 0, "addr": last_write_addr, "data": 0, "kind": "raw"}
+    return {"read": 1, "write": 0, "addr": random.randrange(WORDS), "data": 0, "kind": "random"}
+
+
+def drive(dut, cmd):
+    dut.read.value = cmd["read"] if cmd else 0
+    dut.write.value = cmd["write"] if cmd else 0
+    if cmd:
+        dut.address.value = cmd["addr"]
+        dut.writedata.value = cmd["data"]
+
+
+async def run_pipelined(dut, shadow, commands, start_cycle=0):
+    """commands 를 매 사이클 하나씩 연속 인가하고, 모든 읽기 응답이 돌아올 때까지 진행한다.
+
+    RisingEdge 직후에 읽는 값은 Edge 이전 값이므로, 같은 Edge에서
+    (1) 이전 명령의 응답 확인 -> (2) 이번 Edge에 샘플링된 명령 반영 -> (3) 다음 명령 인가 순으로 처리한다.
+    """
+    cycle = start_cycle
+    issued = None
+    commands = iter(commands)
+    cmd = next(commands, None)
+    drive(dut, cmd)
+    first_issue = cycle + 1
+    ops = 0
+    while cmd is not None or shadow.pending:
+        await RisingEdge(dut.clk)
+        cycle += 1
+        if dut.readdatavalid.value == 1:
+            shadow.respond(cycle, int(dut.readdata.value))
+        if cmd is not None:
+            shadow.issue(cycle, cmd)
+            issued = cycle
+            ops += 1
+        cmd = next(commands, None)
+        drive(dut, cmd)
+        if cmd is None and cycle - issued > 16:
+            raise AssertionError(f"{len(shadow.pending)} reads never returned readdatavalid")
+    return cycle, ops, cycle - first_issue + 1
+
+
+def stress_commands(count):
+    last_write_addr = None
+    for _ in range(count):
+        cmd = random_command(last_write_addr)
+        last_write_addr = cmd["addr"] if cmd["write"] else None
+        yield cmd
+
+
+@cocotb.test()
+async def test_dpram_pipelined_stress(dut):
+    """Pipelined random Avalon-MM reads/writes every cycle against a NumPy shadow memory"""
+
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+
+    dut.read.value = 0
+    dut.write.value = 0
+    dut.address.value = 0
+    dut.writedata.value = 0
+    dut.reset_n.value = 0
+    await Timer(40, unit="ns")
+    dut.reset_n.value = 1
+    await RisingEdge(dut.clk)
+
+    shadow = ShadowMemory()
+
+    # 1. 연속 쓰기로 전체 256 워드를 알려진 값으로 초기화 (이전 테스트의 RAM 내용 무시)
+    fill = ({"read": 0, "write": 1, "addr": a, "data": random.getrandbits(32)} for a in range(WORDS))
+    cycle, _, _ = await run_pipelined(dut, shadow, fill)
+
+    # 2. 랜덤 주소, 매 사이클 읽기/쓰기
+    cycle, ops, cycles = await run_pipelined(dut, shadow, stress_commands(STRESS_OPS), cycle)
+
+    # 3. 연속 읽기로 전체 메모리 비교
+    sweep = ({"read": 1, "write": 0, "addr": a, "data": 0, "kind": "sweep"} for a in range(WORDS))
+    await run_pipelined(dut, shadow, sweep, cycle)
+
+    lat = shadow.latency_summary()
+    dut._log.info(f"[dpram stress] {ops} ops in {cycles} cycles = {ops / cycles:.3f} ops/cycle "
+                  f"({ops * 1000.0 / (cycles * CLOCK_PERIOD_NS):.1f} Mops/s), "
+                  f"{shadow.reads} reads / {shadow.writes} writes")
+    dut._log.info(f"[dpram stress] read latency min/mean/p99/max = "
+                  f"{lat['min']}/{lat['mean']:.2f}/{lat['p99']}/{lat['max']} cycles")
+    for kind in READ_KINDS:
+        dut._log.info(f"[dpram stress] {kind:>6} reads: {shadow.checked[kind]:>6} checked, "
+                      f"{shadow.errors[kind]} mismatches")
+
+    diff = np.flatnonzero(shadow.readback != shadow.mem)
+    assert diff.size == 0, \
+        f"{diff.size} words differ from shadow memory, first @0x{int(diff[0]):02X}: " \
+        f"Expected 0x{int(shadow.mem[diff[0]]):08X}, Got 0x{int(shadow.readback[diff[0]]):08X}"
+    assert sum(shadow.errors.values()) == 0, f"Read mismatches {shadow.errors}: {shadow.first_error}"
+    assert lat["min"] == lat["max"], f"Read latency is not fixed ({lat['min']}..{lat['max']} cycles)"
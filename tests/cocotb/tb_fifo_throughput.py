@@ -0,0 +1,99 @@
+import random
+from collections import deque
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge, Timer
+
+import sweep
+from sopc_index import env_clock_period_ns, mb_per_s
+from fifo_monitor import FifoStats, fifo_depth
+from st_latency import BACKPRESSURE_PROFILES
+
+WORDS_PER_PROFILE = 2048
+# 생산자: burst_master Read Master 처럼 256 워드 Burst를 연속으로 넣고 쉬는 패턴
+PRODUCER_BURST = 256
+PRODUCER_GAP = 64
+
+CLOCK_PERIOD_NS = env_clock_period_ns()
+
+
+def producer_active(cycle):
+    return cycle % (PRODUCER_BURST + PRODUCER_GAP) < PRODUCER_BURST
+
+
+async def run_profile(dut, name, consumer, depth, data_width):
+    """Burst 생산자 -> FIFO -> consumer 프로파일 소비자. 순서/데이터를 확인하고 통계를 반환"""
+    dut.wr_en.value = 0
+    dut.rd_en.value = 0
+    dut.rst_n.value = 0
+    await Timer(40, unit="ns")
+    dut.rst_n.value = 1
+    await RisingEdge(dut.clk)
+
+    stats = FifoStats(f"{dut._name} {name}", depth)
+    expected = deque()
+    mask = (1 << data_width) - 1
+    data = random.getrandbits(data_width) & mask
+    sent = received = cycle = blocked = 0
+    wr = rd = 0
+    while received < WORDS_PER_PROFILE:
+        await RisingEdge(dut.clk)
+        cycle += 1
+        full = dut.full.value == 1
+        empty = dut.empty.value == 1
+        stats.sample(int(dut.used_w.value), full, empty, wr, rd)
+
+        if wr and not full:
+            expected.append(data)
+            sent += 1
+            data = random.getrandbits(data_width) & mask
+        elif wr:
+            blocked += 1
+        if rd and not empty:
+            got = int(dut.rd_data.value)
+            exp = expected.popleft()
+            assert got == exp, f"[{name}] word {received}: Expected 0x{exp:X}, Got 0x{got:X}"
+            received += 1
+
+        wr = 1 if sent < WORDS_PER_PROFILE and producer_active(cycle) else 0
+        rd = 1 if consumer(cycle) else 0
+        dut.wr_en.value = wr
+        dut.wr_data.value = data
+        dut.rd_en.value = rd
+        assert cycle < WORDS_PER_PROFILE * 20, f"[{name}] FIFO stopped moving data"
+
+    dut.wr_en.value = 0
+    dut.rd_en.value = 0
+    stats.report(dut._log)
+    return {
+        "profile": name,
+        "items": received,
+        "cycles": cycle,
+        "items_per_cycle": received / cycle,
+        "mb_per_s": mb_per_s(received * ((data_width + 7) // 8), cycle, CLOCK_PERIOD_NS),
+        "blocked_cycles": blocked,
+        "peak": stats.peak,
+        "full_cycles": stats.full_cycles,
+    }
+
+
+@cocotb.test()
+async def test_fifo_throughput(dut):
+    """simple_fifo throughput with a bursty producer and backpressured consumer"""
+
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+
+    depth = fifo_depth(dut)
+    data_width = len(dut.wr_data)
+
+    results = []
+    for name, consumer in BACKPRESSURE_PROFILES.items():
+        results.append(await run_profile(dut, name, consumer, depth, data_width))
+
+    dut._log.info(f"{'DEPTH':>6} {'WIDTH':>6} {'profile':>12} {'items/cyc':>9} {'MB/s':>8} "
+                  f"{'blocked':>8} {'peak':>6}")
+    for r in results:
+        dut._log.info(f"{depth:>6} {data_width:>6} {r['profile']:>12} {r['items_per_cycle']:>9.3f} "
+                      f"{r['mb_per_s']:>8.1f} {r['blocked_cycles']:>8} {r['peak']:>6}")
+    sweep.write_record(results)
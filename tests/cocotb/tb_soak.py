@@ -0,0 +1,285 @@
+import os
+import random
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from soak import (MASK32, RingScoreboard, SoakBudget, SoakReport, ThroughputWindows,
+                  soak_word, stream_expected)
+from tb_burst_master import (AvalonMemory, DUT_CAPS, MM_BACKPRESSURE_PROFILES, expected_word,
+                             write_csr, read_csr, reset_burst_master,
+                             CLOCK_PERIOD_NS, DMA_SRC_BASE, DMA_DST_BASE)
+
+# 윈도우 길이 / 요약 주기 / 허용 Throughput 편차 / 허용 RSS 증가량
+SOAK_WINDOW = int(os.environ.get("SOAK_WINDOW", 20000))
+SOAK_REPORT_CYCLES = int(os.environ.get("SOAK_REPORT_CYCLES", 100000))
+SOAK_TOLERANCE = float(os.environ.get("SOAK_TOLERANCE", 0.15))
+SOAK_RSS_LIMIT_MB = float(os.environ.get("SOAK_RSS_LIMIT_MB", 64))
+# asi_valid_count 를 wrap 직전 값으로 미리 로드 (2^32 사이클을 기다리지 않기 위해)
+SOAK_WRAP_MARGIN = int(os.environ.get("SOAK_WRAP_MARGIN", 1000))
+
+# Burst Master soak 전송: 4KB (256 워드 Burst x 4) 를 64KB 창 안에서 돌려가며 반복
+TRANSFER_BYTES = 4096
+ADDRESS_WINDOW = 0x10000
+WRAP_EVERY = 64  # N번째 전송마다 주소가 2^32 를 넘어가도록 배치
+COEFF = 3
+
+STREAM_DUTS = ("stream_processor", "stream_processor_simd")
+
+
+class SoakTracker:
+    """사이클 카운트, 윈도우 Throughput, 주기적 요약을 담당 (모니터 코루틴 1개)"""
+
+    def __init__(self, dut, label, scoreboard, budget):
+        self.dut = dut
+        self.scoreboard = scoreboard
+        self.budget = budget
+        self.windows = ThroughputWindows(SOAK_WINDOW)
+        self.report = SoakReport(dut._log, label, max(SOAK_REPORT_CYCLES, SOAK_WINDOW))
+        self.cycle = 0
+        self.items = 0  # 이번 사이클에 완료된 항목 수 (드라이버/모니터가 증가)
+        self.extra = lambda: ""
+        self._task = None
+
+    def start(self):
+        self._task = cocotb.start_soon(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.kill()
+            self._task = None
+
+    @property
+    def done(self):
+        return self.budget.exhausted(self.cycle)
+
+    async def _run(self):
+        while True:
+            await RisingEdge(self.dut.clk)
+            self.cycle += 1
+            items, self.items = self.items, 0
+            if self.windows.sample(items) is not None and self.windows.windows == self.windows.warmup:
+                self.report.mark_baseline()
+            self.report.maybe_report(self.cycle, self.budget, self.scoreboard, self.windows, self.extra())
+
+    def finish(self, unit):
+        """최종 요약 출력 및 공통 검사 (데이터, Throughput 안정성, 메모리)"""
+        self.report.report(self.cycle, self.budget, self.scoreboard, self.windows, self.extra())
+        s = self.windows.summary()
+        log = self.dut._log
+        log.info(f"[Soak {self.report.label}] {self.cycle} cycles, {s['windows']} windows of {SOAK_WINDOW}: "
+                 f"{unit}/cycle min/mean/max = {s['min']:.3f}/{s['mean']:.3f}/{s['max']:.3f}, "
+                 f"RSS growth {self.report.rss_growth:.1f}MB")
+        for m in self.scoreboard.mismatches:
+            log.error(f"[Soak {self.report.label}] {m}")
+
+        assert self.scoreboard.errors == 0, \
+            f"{self.scoreboard.errors} mismatches (last: {self.scoreboard.mismatches[-1]})"
+        assert self.windows.steady(SOAK_TOLERANCE), \
+            f"Throughput drifted beyond ±{SOAK_TOLERANCE:.0%}: min/mean/max = " \
+            f"{s['min']:.3f}/{s['mean']:.3f}/{s['max']:.3f} {unit}/cycle"
+        assert self.report.rss_growth <= SOAK_RSS_LIMIT_MB, \
+            f"RSS grew by {self.report.rss_growth:.1f}MB during soak (limit {SOAK_RSS_LIMIT_MB}MB)"
+
+
+class SoakMemory(AvalonMemory):
+    """저장하지 않는 메모리 모델: 읽기는 soak_word 생성기, 쓰기는 스코어보드로 즉시 비교"""
+
+    def __init__(self, dut, scoreboard, tracker):
+        super().__init__(dut, "MEM_SOAK", verbose=False)
+        self.scoreboard = scoreboard
+        self.tracker = tracker
+        self.seed = 0
+
+    def read_word(self, addr):
+        return soak_word(addr & MASK32, self.seed)
+
+    def write_word(self, addr, data):
+        self.scoreboard.check((addr & MASK32, data))
+        self.tracker.items += 1
+
+
+def transfer_addresses(index, length):
+    """index번째 전송의 (src, dst). WRAP_EVERY 마다 두 주소 모두 2^32 경계를 넘는다"""
+    if index % WRAP_EVERY == 0:
+        return (1 << 32) - length // 2, (1 << 32) - length // 4
+    offset = (index * length) % ADDRESS_WINDOW
+    return DMA_SRC_BASE + offset, DMA_DST_BASE + offset
+
+
+async def soak_burst_master(dut, budget):
+    caps = DUT_CAPS[dut._name]
+    coeff = COEFF if caps["coeff"] else 1
+
+    dut.avs_write.value = 0
+    dut.avs_read.value = 0
+    dut.avs_address.value = 0
+    dut.avs_writedata.value = 0
+    dut.rm_waitrequest.value = 1
+    dut.wm_waitrequest.value = 1
+    await reset_burst_master(dut)
+
+    scoreboard = RingScoreboard(f"{dut._name} writes", depth=TRANSFER_BYTES // 4)
+    tracker = SoakTracker(dut, dut._name, scoreboard, budget)
+    mem_model = SoakMemory(dut, scoreboard, tracker)
+    mem_model.read_wait_prob, mem_model.write_wait_prob = MM_BACKPRESSURE_PROFILES["light"]
+    mem_model.start_read_monitor()
+    cocotb.start_soon(mem_model.write_monitor())
+
+    if caps["prog_burst"]:
+        await write_csr(dut, 5, 256)
+        await write_csr(dut, 6, 256)
+    if caps["coeff"]:
+        await write_csr(dut, 7, coeff)
+
+    transfers = wraps = 0
+    tracker.extra = lambda: f"transfers={transfers} wraps={wraps}"
+    tracker.start()
+    while not tracker.done:
+        src, dst = transfer_addresses(transfers, TRANSFER_BYTES)
+        mem_model.seed = transfers
+        await write_csr(dut, 2, src & MASK32)
+        await write_csr(dut, 3, dst & MASK32)
+        await write_csr(dut, 4, TRANSFER_BYTES)
+        for i in range(0, TRANSFER_BYTES, 4):
+            val = soak_word((src + i) & MASK32, transfers)
+            scoreboard.push(((dst + i) & MASK32, expected_word(dut._name, val, coeff)))
+
+        await write_csr(dut, 0, 1) # Start
+        timeout = (TRANSFER_BYTES // 4) * 20 + 2000
+        while True:
+            await RisingEdge(dut.clk)
+            timeout -= 1
+            if timeout % 10 == 0 and (int(await read_csr(dut, 1)) & 1) == 1:
+                break
+            assert timeout > 0, f"Transfer {transfers} (src=0x{src & MASK32:08X}) timed out"
+        await write_csr(dut, 1, 1) # Clear Done -> Re-arm
+
+        assert scoreboard.pending == 0, \
+            f"Transfer {transfers}: {scoreboard.pending} words missing after Done"
+        if src + TRANSFER_BYTES > (1 << 32):
+            wraps += 1
+        transfers += 1
+
+    tracker.stop()
+    tracker.finish("words")
+    assert wraps > 0, "No transfer crossed the 32-bit address boundary"
+
+
+async def read_stream_csr(dut, address):
+    dut.avs_address.value = address
+    dut.avs_read.value = 1
+    await RisingEdge(dut.clk)
+    dut.avs_read.value = 0
+    await RisingEdge(dut.clk)
+    return int(dut.avs_readdata.value)
+
+
+async def soak_stream_processor(dut, budget):
+    dut.asi_valid.value = 0
+    dut.asi_data.value = 0
+    dut.aso_ready.value = 1
+    dut.avs_write.value = 0
+    dut.avs_read.value = 0
+    dut.reset_n.value = 0
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+    dut.reset_n.value = 1
+    await RisingEdge(dut.clk)
+
+    # coeff_a 설정 (bypass=0)
+    dut.avs_address.value = 0
+    dut.avs_writedata.value = COEFF
+    dut.avs_write.value = 1
+    await RisingEdge(dut.clk)
+    dut.avs_write.value = 0
+
+    # asi_valid_count 를 wrap 직전 값으로 로드 (입력이 없는 동안이라 카운터가 멈춰 있음)
+    preload = None
+    if hasattr(dut, "asi_valid_count"):
+        preload = ((1 << 32) - SOAK_WRAP_MARGIN) & MASK32
+        dut.asi_valid_count.value = preload
+        await RisingEdge(dut.clk)
+        got = await read_stream_csr(dut, 2)
+        assert got == preload, f"asi_valid_count preload failed: 0x{got:08X}"
+    else:
+        dut._log.warning("asi_valid_count is not accessible; skipping counter wrap check")
+
+    data_width = len(dut.asi_data)
+    lanes = data_width // 32
+
+    def beat(seq):
+        words = [soak_word(seq * lanes + lane) for lane in range(lanes)]
+        data = sum(w << (32 * lane) for lane, w in enumerate(words))
+        expected = sum(stream_expected(w, COEFF) << (32 * lane) for lane, w in enumerate(words))
+        return data, expected
+
+    scoreboard = RingScoreboard(f"{dut._name} aso", depth=64)
+    tracker = SoakTracker(dut, dut._name, scoreboard, budget)
+    valid_cycles = 0
+    tracker.extra = lambda: f"asi_valid_count={((preload or 0) + valid_cycles) & MASK32:#010x}"
+    tracker.start()
+
+    # asi_valid 는 항상 1 (back-to-back), aso_ready 는 10% 랜덤 Stall
+    seq = 0
+    data, expected = beat(seq)
+    dut.asi_valid.value = 1
+    dut.asi_data.value = data
+    while not tracker.done:
+        await RisingEdge(dut.clk)
+        valid_cycles += 1
+        if dut.asi_ready.value == 1:
+            scoreboard.push(expected)
+            seq += 1
+            data, expected = beat(seq)
+            dut.asi_data.value = data
+        if dut.aso_valid.value == 1 and dut.aso_ready.value == 1:
+            scoreboard.check(int(dut.aso_data.value))
+            tracker.items += 1
+        dut.aso_ready.value = 1 if random.random() >= 0.1 else 0
+
+    # 드레인
+    dut.asi_valid.value = 0
+    dut.aso_ready.value = 1
+    for _ in range(64):
+        if not scoreboard.pending:
+            break
+        await RisingEdge(dut.clk)
+        if dut.aso_valid.value == 1:
+            scoreboard.check(int(dut.aso_data.value))
+    assert scoreboard.pending == 0, f"{scoreboard.pending} beats did not drain"
+
+    tracker.stop()
+    tracker.finish("beats")
+
+    if preload is not None:
+        await RisingEdge(dut.clk)
+        count = await read_stream_csr(dut, 2)
+        expected_count = (preload + valid_cycles) & MASK32
+        dut._log.info(f"[Soak {dut._name}] asi_valid_count 0x{preload:08X} + {valid_cycles} -> 0x{count:08X}")
+        assert count == expected_count, \
+            f"asi_valid_count: expected 0x{expected_count:08X}, got 0x{count:08X}"
+        if preload + valid_cycles < (1 << 32):
+            dut._log.warning("Soak ended before asi_valid_count wrapped (increase SOAK_CYCLES)")
+
+
+@cocotb.test()
+async def test_soak(dut):
+    """Long-running back-to-back traffic with bounded memory and counter wrap checks (SOAK_CYCLES/SOAK_SECONDS)"""
+
+    budget = SoakBudget.from_env()
+    if budget is None:
+        dut._log.info("Soak disabled (set SOAK_CYCLES or SOAK_SECONDS)")
+        return
+    if dut._name not in DUT_CAPS and dut._name not in STREAM_DUTS:
+        dut._log.info(f"No soak workload for {dut._name}")
+        return
+
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+    dut._log.info(f"[Soak {dut._name}] running for {budget}")
+
+    if dut._name in STREAM_DUTS:
+        await soak_stream_processor(dut, budget)
+    else:
+        await soak_burst_master(dut, budget)
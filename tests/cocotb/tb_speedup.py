@@ -0,0 +1,131 @@
+import json
+import os
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.triggers import RisingEdge
+
+from soak import MASK32, RingScoreboard, stream_expected
+from speedup import RECORD_NAME
+from st_latency import StLatencyMonitor, drive_stream
+from tb_burst_master import (AvalonMemory, Scenario, run_scenario, reset_burst_master,
+                             CLOCK_PERIOD_NS, DMA_SRC_BASE, DMA_DST_BASE)
+
+# main.c 와 동일한 워크로드 크기
+DATA_SIZE = 256
+COEFF_A = 3
+
+# DUT별 워크로드: (workload 이름, 소프트웨어 커널)
+WORKLOADS = {
+    "burst_master":          ("DMA copy (BM1)", "copy"),
+    "burst_master_4":        ("Mult + /400 (BM4)", "mult_div"),
+    "stream_processor":      ("Stream Mult + /400", "mult_div"),
+    "stream_processor_simd": ("SIMD Stream Mult + /400", "mult_div"),
+}
+
+
+def write_record(dut, workload, kernel, elements, hw_cycles):
+    """측정 결과를 sim_build/<toplevel>/speedup.json 에 기록 (speedup.py가 집계)"""
+    record = {
+        "dut": dut._name,
+        "workload": workload,
+        "kernel": kernel,
+        "elements": elements,
+        "hw_cycles": hw_cycles,
+        "clock_period_ns": CLOCK_PERIOD_NS,
+    }
+    path = os.path.join(os.environ.get("SIM_BUILD", os.getcwd()), RECORD_NAME)
+    with open(path, "w") as f:
+        json.dump([record], f, indent=2)
+    dut._log.info(f"[Speedup] {workload}: {elements} elements in {hw_cycles} HW cycles -> {path}")
+
+
+async def measure_burst_master(dut):
+    dut.avs_write.value = 0
+    dut.avs_read.value = 0
+    dut.avs_address.value = 0
+    dut.avs_writedata.value = 0
+    dut.rm_waitrequest.value = 1
+    dut.wm_waitrequest.value = 1
+    await reset_burst_master(dut)
+
+    mem_model = AvalonMemory(dut, "MEM_SPEEDUP")
+    mem_model.start_read_monitor()
+    cocotb.start_soon(mem_model.write_monitor())
+
+    sc = Scenario("speedup", DMA_SRC_BASE, DMA_DST_BASE, DATA_SIZE * 4, coeff=COEFF_A)
+    result = await run_scenario(dut, mem_model, sc, CLOCK_PERIOD_NS)
+    assert result["status"] == "PASS", f"Speedup workload failed: {result['reason']}"
+    return result["cycles"]
+
+
+async def check_stream_output(dut, scoreboard, lanes):
+    """수락된 입력 beat의 기대값(레인별 RTL 연산)과 출력 beat(aso_data)를 순서대로 비교"""
+    while True:
+        await RisingEdge(dut.clk)
+        if dut.asi_valid.value == 1 and dut.asi_ready.value == 1:
+            data = int(dut.asi_data.value)
+            scoreboard.push(sum(stream_expected((data >> (32 * lane)) & MASK32, COEFF_A) << (32 * lane)
+                                for lane in range(lanes)))
+        if dut.aso_valid.value == 1 and dut.aso_ready.value == 1:
+            scoreboard.check(int(dut.aso_data.value))
+
+
+async def measure_stream_processor(dut):
+    dut.asi_valid.value = 0
+    dut.asi_data.value = 0
+    dut.aso_ready.value = 1
+    dut.avs_write.value = 0
+    dut.avs_read.value = 0
+    dut.reset_n.value = 0
+    await RisingEdge(dut.clk)
+    await RisingEdge(dut.clk)
+    dut.reset_n.value = 1
+    await RisingEdge(dut.clk)
+
+    # coeff_a 설정 (bypass=0 이 기본값)
+    dut.avs_address.value = 0
+    dut.avs_writedata.value = COEFF_A
+    dut.avs_write.value = 1
+    await RisingEdge(dut.clk)
+    dut.avs_write.value = 0
+
+    data_width = len(dut.asi_data)
+    lanes = data_width // 32
+    beats = DATA_SIZE // lanes  # SIMD: 4 원소 / beat
+    monitor = StLatencyMonitor(dut, f"{dut._name} speedup")
+    monitor.start()
+    # 출력이 틀린 데이터패스의 사이클 수가 Speedup 리포트에 실리지 않도록 결과도 확인
+    scoreboard = RingScoreboard(f"{dut._name} speedup", depth=beats)
+    checker = cocotb.start_soon(check_stream_output(dut, scoreboard, lanes))
+    await drive_stream(dut, beats, data_width)
+    for _ in range(beats * 10):
+        # 모니터와 체커가 같은 Edge에서 어느 쪽이 먼저 실행될지 모르므로 둘 다 기다린다
+        if len(monitor.stats.latencies) == beats and scoreboard.matched + scoreboard.errors == beats:
+            break
+        await RisingEdge(dut.clk)
+    monitor.stop()
+    checker.kill()
+    assert len(monitor.stats.latencies) == beats, "Stream did not drain"
+    assert scoreboard.errors == 0, \
+        f"{scoreboard.errors} output beats mismatched: {'; '.join(scoreboard.mismatches)}"
+    assert scoreboard.matched == beats, f"Only {scoreboard.matched}/{beats} output beats checked"
+    return monitor.stats.cycles
+
+
+@cocotb.test()
+async def test_speedup_workload(dut):
+    """Measure HW cycles of the main.c workload for the SW vs HW speedup report"""
+
+    if dut._name not in WORKLOADS:
+        dut._log.info(f"No speedup workload for {dut._name}")
+        return
+
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+
+    workload, kernel = WORKLOADS[dut._name]
+    if dut._name.startswith("burst_master"):
+        hw_cycles = await measure_burst_master(dut)
+    else:
+        hw_cycles = await measure_stream_processor(dut)
+    write_record(dut, workload, kernel, DATA_SIZE, hw_cycles)
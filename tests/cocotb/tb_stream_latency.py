@@ -0,0 +1,95 @@
+import cocotb
+from cocotb.triggers import RisingEdge, Timer
+from cocotb.clock import Clock
+
+import sweep
+from sopc_index import env_clock_period_ns, mb_per_s
+from st_latency import BACKPRESSURE_PROFILES, StLatencyMonitor, drive_stream, drive_backpressure
+
+ITEMS_PER_PROFILE = 200
+
+CLOCK_PERIOD_NS = env_clock_period_ns()
+
+
+async def reset_dut(reset_n, duration_ns):
+    reset_n.value = 0
+    await Timer(duration_ns, unit="ns")
+    reset_n.value = 1
+    await Timer(duration_ns, unit="ns")
+
+
+def get_param(dut, name, default):
+    """RTL parameter 값을 읽는다 (simulator가 노출하지 않으면 기본값)"""
+    try:
+        return int(getattr(dut, name).value)
+    except (AttributeError, ValueError):
+        return default
+
+
+@cocotb.test()
+async def test_stream_latency(dut):
+    """Per-item Ingress->Egress latency under aso_ready backpressure profiles"""
+
+    # Start Clock (50MHz)
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
+
+    dut.asi_valid.value = 0
+    dut.asi_data.value = 0
+    dut.aso_ready.value = 0
+    # pipe_template에는 CSR 포트가 없음
+    if hasattr(dut, "avs_write"):
+        dut.avs_write.value = 0
+        dut.avs_read.value = 0
+        dut.avs_address.value = 0
+        dut.avs_writedata.value = 0
+
+    stages = get_param(dut, "STAGES", 3)
+    data_width = len(dut.asi_data)
+    # SIMD는 LANES 개의 32-bit 레인만 유효 (포트 폭은 128-bit 고정)
+    lanes = get_param(dut, "LANES", 0)
+    bytes_per_beat = lanes * 4 if lanes else (data_width + 7) // 8
+
+    results = {}
+    for name, profile in BACKPRESSURE_PROFILES.items():
+        # 프로파일마다 리셋하여 이전 측정의 잔여 데이터가 섞이지 않도록 함
+        await reset_dut(dut.reset_n, 40)
+        await RisingEdge(dut.clk)
+
+        label = f"{dut._name} STAGES={stages} profile={name}"
+        monitor = StLatencyMonitor(dut, label)
+        monitor.start()
+        bp_task = cocotb.start_soon(drive_backpressure(dut, profile))
+
+        await drive_stream(dut, ITEMS_PER_PROFILE, data_width)
+
+        # 파이프라인 드레인 대기
+        for _ in range(ITEMS_PER_PROFILE * 20):
+            if len(monitor.stats.latencies) == ITEMS_PER_PROFILE:
+                break
+            await RisingEdge(dut.clk)
+
+        bp_task.kill()
+        monitor.stop()
+        dut.aso_ready.value = 0
+
+        monitor.stats.report(dut._log)
+        summary = monitor.stats.summary()
+        results[(stages, name)] = summary
+
+        assert summary["items"] == ITEMS_PER_PROFILE, \
+            f"[{label}] Expected {ITEMS_PER_PROFILE} output beats, got {summary['items']}"
+        # Stall이 없으면 모든 항목의 지연이 파이프라인 깊이로 일정해야 함
+        if name == "none":
+            assert summary["min"] == summary["max"], \
+                f"[{label}] Latency varies ({summary['min']}..{summary['max']}) without backpressure"
+
+    dut._log.info(f"{'STAGES':>6} {'profile':>12} {'min':>5} {'p50':>5} {'p99':>5} {'max':>5} "
+                  f"{'stall':>7} {'items/cyc':>9} {'MB/s':>8}")
+    records = []
+    for (st, name), s in results.items():
+        mbps = mb_per_s(s["items"] * bytes_per_beat, s["cycles"], CLOCK_PERIOD_NS)
+        dut._log.info(f"{st:>6} {name:>12} {s['min']:>5} {s['p50']:>5} {s['p99']:>5} {s['max']:>5} "
+                      f"{s['stall_cycles']:>7} {s['throughput']:>9.3f} {mbps:>8.1f}")
+        records.append({"profile": name, "items_per_cycle": s["throughput"], "mb_per_s": mbps,
+                        "p50": s["p50"], "p99": s["p99"], "stall_cycles": s["stall_cycles"]})
+    sweep.write_record(records)
@@ -2,6 +2,10 @@ import cocotb
 from cocotb.triggers import RisingEdge, Timer
 from cocotb.clock import Clock
 
+from sopc_index import env_clock_period_ns
+
+CLOCK_PERIOD_NS = env_clock_period_ns()
+
 async def reset_dut(reset_n, duration_ns):
     reset_n.value = 0
     await Timer(duration_ns, unit="ns")
@@ -13,7 +17,7 @@ async def test_stream_processor_avs(dut):
     """Test Avalon-MM Slave interface of stream_processor"""
     
     # Start Clock (50MHz)
-    cocotb.start_soon(Clock(dut.clk, 20, unit="ns").start())
+    cocotb.start_soon(Clock(dut.clk, CLOCK_PERIOD_NS, unit="ns").start())
     
     # Reset
     await reset_dut(dut.reset_n, 40)
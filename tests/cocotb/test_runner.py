@@ -1,14 +1,153 @@
+import contextlib
+import json
 import os
+import random
 import pytest
 from cocotb_test.simulator import run
 
+import sopc_index
+import speedup
+import sweep
+import wave_capture
+
 # 프로젝트 루트 경로 설정 (RTL 및 IP 경로 확인용)
 PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 
+# Platform Designer 시스템 정보 (클럭 주기 등). 파일 해시 기준으로 캐시됨
+SOPC = sopc_index.load_index()
+
+
+def sopc_env(toplevel):
+    """testbench에 전달할 시스템 설정 (실제 클럭 주기, DMA 소스/목적지 주소)"""
+    return {
+        "CLOCK_PERIOD_NS": str(SOPC.clock_period_ns(toplevel)),
+        "DMA_SRC_BASE": hex(SOPC.base_address("onchip_memory2_0.s1", "dma_onchip_dp.mm_read")),
+        "DMA_DST_BASE": hex(SOPC.base_address("mmio_0.s0", "dma_onchip_dp.mm_write")),
+    }
+
+
+def _build_config_changed(sim_build, config):
+    """빌드 구성(파형 설정 등)이 이전 빌드와 다르면 True. 스탬프 파일을 갱신한다.
+
+    cocotb-test는 소스 파일 mtime만 보고 <toplevel>.vvp 재사용 여부를 판단하므로,
+    wave_ctrl 을 빼거나 설정만 바꾼 경우에도 이전 빌드(덤프 포함)를 그대로 쓰게 된다.
+    스탬프가 없으면(이전 버전의 waves=True 빌드 등) 항상 다시 컴파일한다.
+    """
+    stamp = os.path.join(sim_build, "build_config.json")
+    previous = None
+    if os.path.exists(stamp):
+        with open(stamp) as f:
+            previous = json.load(f)
+    current = json.loads(json.dumps(config))
+    os.makedirs(sim_build, exist_ok=True)
+    with open(stamp, "w") as f:
+        json.dump(current, f)
+    return previous != current
+
+
+@contextlib.contextmanager
+def _results_file(path):
+    """실행 동안 COCOTB_RESULTS_FILE 을 path 로 지정한다.
+
+    cocotb-test 0.2.6은 results_xml 인자를 무시하고, 이 환경 변수가 없으면
+    sim_build 에 임시 이름(tmpXXXX_results.xml)으로 결과를 쓴다.
+    """
+    previous = os.environ.get("COCOTB_RESULTS_FILE")
+    os.environ["COCOTB_RESULTS_FILE"] = os.path.abspath(path)
+    if os.path.exists(path):
+        os.remove(path) # 비정상 종료 시 이전 실행 결과를 읽지 않도록
+    try:
+        yield path
+    finally:
+        if previous is None:
+            del os.environ["COCOTB_RESULTS_FILE"]
+        else:
+            os.environ["COCOTB_RESULTS_FILE"] = previous
+
+
+def _results_path(sim_build):
+    return os.path.join(sim_build, "results.xml")
+
+
+def _sim_options(toplevel, module, sources, sim_build, wave_spec=None, wave_format="vcd", detect_only=False,
+                 seed=None):
+    """cocotb-test run() 인자. wave_spec이 있으면 wave_ctrl 모듈을 함께 컴파일한다."""
+    extra_sources, compile_args, plus_args = [], [], []
+    if wave_spec is not None and wave_spec.mode != "off":
+        extra_sources.append(wave_capture.write_wave_ctrl(
+            sim_build, toplevel, wave_spec, wave_format, detect_only=detect_only))
+        compile_args = ["-s", "wave_ctrl"]
+        plus_args = wave_capture.sim_args(wave_format)
+    config = {
+        "waves": list(wave_spec) if extra_sources else None,
+        "format": wave_format if extra_sources else None,
+        "detect_only": detect_only if extra_sources else False,
+        "compile_args": compile_args,
+    }
+    extra_env = dict(sopc_env(toplevel), SIM_BUILD=os.path.abspath(sim_build)) # 실제 시스템 클럭 주기 및 주소 맵
+    if seed is not None:
+        extra_env["RANDOM_SEED"] = str(seed) # 재시뮬레이션이 같은 랜덤 시퀀스를 따르도록
+    return dict(
+        extra_env=extra_env,
+        force_compile=_build_config_changed(sim_build, config), # 파형 설정이 바뀌면 재컴파일
+        verilog_sources=sources + extra_sources,
+        toplevel=toplevel,
+        module=module,
+        waves=False, # 파형은 wave_ctrl로만 제어 (기본 OFF)
+        compile_args=compile_args,
+        plus_args=plus_args, # vvp 확장 인자 (-fst)
+        sim_build=sim_build, # 각 모듈별로 독립된 빌드 디렉토리 사용 (충돌 방지)
+    )
+
+
+def _run_sim(toplevel, module, sources, sim_build, wave_spec=None, wave_format="vcd", detect_only=False,
+             seed=None):
+    """단일 시뮬레이션 실행. 결과 XML은 sim_build/results.xml 로 모은다."""
+    options = _sim_options(toplevel, module, sources, sim_build, wave_spec, wave_format, detect_only, seed)
+    with _results_file(_results_path(sim_build)), wave_capture.hide_waves_env():
+        run(simulator="icarus", **options) # WAVES(off/full/...)는 cocotb-test가 정수로 해석하므로 숨김
+
+
+def run_module(toplevel, module, sources, sim_build, waves=None, wave_format=None):
+    """WAVES 설정에 따라 파형 캡처 방식을 선택하여 시뮬레이션을 실행한다."""
+    spec = wave_capture.parse_wave_spec(waves if waves is not None else os.environ.get("WAVES", "off"))
+    fmt = (wave_format or os.environ.get("WAVES_FORMAT", "vcd")).lower()
+
+    if spec.mode == "mismatch":
+        # 1차: 덤프 없이 Full Speed 실행. 실패 시에만 첫 실패 지점 주변을 다시 덤프
+        # 두 실행이 같은 RANDOM_SEED 를 써야 실패 지점(사이클)이 일치한다
+        seed = int(os.environ.get("RANDOM_SEED") or random.getrandbits(31))
+        try:
+            _run_sim(toplevel, module, sources, sim_build, seed=seed)
+        except (SystemExit, Exception):
+            period = SOPC.clock_period_ns(toplevel)
+            cycle = wave_capture.first_failure_cycle(_results_path(sim_build), period)
+            if cycle is not None:
+                window = wave_capture.window_around(cycle, spec.pre, spec.post)
+                try:
+                    _run_sim(toplevel, module, sources, sim_build, window, fmt, seed=seed)
+                except (SystemExit, Exception):
+                    pass # 재실행도 실패하는 것이 정상 (파형만 필요)
+            else:
+                print(f"WAVES=mismatch: no failing testcase in {_results_path(sim_build)}, waveform not captured")
+            raise
+        return
+
+    if spec.mode == "trigger" and spec.pre > 0:
+        # 1차: trigger 사이클만 탐지, 2차: PRE/POST 구간 덤프
+        _run_sim(toplevel, module, sources, sim_build, spec, fmt, detect_only=True)
+        cycle = wave_capture.read_trigger_cycle(sim_build)
+        if cycle is None:
+            return # trigger 조건이 발생하지 않음 -> 파형 없음
+        spec = wave_capture.window_around(cycle, spec.pre, spec.post)
+
+    _run_sim(toplevel, module, sources, sim_build, spec, fmt)
+
+
 @pytest.mark.parametrize("toplevel, module, sources", [
     (
         "my_custom_slave", 
-        "tb_my_slave", 
+        "tb_my_slave,tb_dpram_stress", 
         [
             os.path.join(PROJ_PATH, "RTL", "my_slave.v"),
             os.path.join(PROJ_PATH, "ip", "dpram.v"),
@@ -17,14 +156,35 @@ PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     ),
     (
         "stream_processor", 
-        "tb_stream_processor_avs", 
+        "tb_stream_processor_avs,tb_stream_latency,tb_speedup,tb_soak", 
         [
             os.path.join(PROJ_PATH, "RTL", "stream_processor.v")
         ]
     ),
+    (
+        "stream_processor_simd", 
+        "tb_stream_latency,tb_speedup,tb_soak", 
+        [
+            os.path.join(PROJ_PATH, "RTL", "stream_processor_simd.v")
+        ]
+    ),
+    (
+        "pipe_template", 
+        "tb_stream_latency", 
+        [
+            os.path.join(PROJ_PATH, "RTL", "pipe_template.v")
+        ]
+    ),
+    (
+        "simple_fifo", 
+        "tb_fifo_throughput", 
+        [
+            os.path.join(PROJ_PATH, "RTL", "simple_fifo.v")
+        ]
+    ),
     (
         "burst_master", 
-        "tb_burst_master", 
+        "tb_burst_master,tb_speedup,tb_soak", 
         [
             os.path.join(PROJ_PATH, "RTL", "burst_master.v"),
             os.path.join(PROJ_PATH, "RTL", "simple_fifo.v")
@@ -32,7 +192,7 @@ PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     ),
     (
         "burst_master_2", 
-        "tb_burst_master", 
+        "tb_burst_master,tb_soak", 
         [
             os.path.join(PROJ_PATH, "RTL", "burst_master_2.v"),
             os.path.join(PROJ_PATH, "RTL", "simple_fifo.v")
@@ -40,7 +200,7 @@ PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
     ),
     (
         "burst_master_4", 
-        "tb_burst_master", 
+        "tb_burst_master,tb_speedup,tb_soak", 
         [
             os.path.join(PROJ_PATH, "RTL", "burst_master_4.v"),
             os.path.join(PROJ_PATH, "RTL", "simple_fifo.v")
@@ -50,12 +210,28 @@ PROJ_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 def test_cocotb_modules(toplevel, module, sources):
     """Pytest runner for Cocotb tests"""
     sim_build = os.path.join("sim_build", toplevel)
-    run(
-        verilog_sources=sources,
-        toplevel=toplevel,
-        module=module,
-        simulator="icarus",
-        waves=True, # cocotb-test의 표준 파형 덤프 활성화
-        sim_build=sim_build, # 각 모듈별로 독립된 빌드 디렉토리 사용 (충돌 방지)
-        results_xml=os.path.join(sim_build, "results.xml") # XML 결과 파일을 빌드 폴더 내로 집중
-    )
+    record = os.path.join(sim_build, speedup.RECORD_NAME)
+    if os.path.exists(record):
+        os.remove(record) # 이전 실행(이전 RTL/실패한 실행)의 측정 결과가 Speedup 리포트에 섞이지 않도록
+    run_module(toplevel, module, sources, sim_build)
+
+
+def test_speedup_report():
+    """tb_speedup 측정 결과로 SW vs HW Speedup 표와 차트를 생성"""
+    if not speedup.load_records("sim_build"):
+        pytest.skip("No speedup measurements (run test_cocotb_modules first)")
+    rows = speedup.report("sim_build", SOPC)
+    assert all(r["speedup"] > 1.0 for r in rows), "Hardware is slower than the software model"
+
+
+@pytest.mark.parametrize("toplevel", sorted(sweep.SWEEPS))
+def test_param_sweep(toplevel):
+    """파라미터 그리드별 빌드(캐시) + Throughput 측정 (SWEEP=simple_fifo,pipe_template,... 로 활성화)"""
+    selected = [t for t in os.environ.get("SWEEP", "").split(",") if t]
+    if toplevel not in selected and "all" not in selected:
+        pytest.skip("Parameter sweep disabled (set SWEEP)")
+    jobs = int(os.environ.get("SWEEP_JOBS", 0)) or None
+    results = sweep.run_sweep(toplevel, root="sim_build", jobs=jobs, extra_env=sopc_env(toplevel))
+    sweep.report(toplevel, results)
+    failed = [r["params"] for r in results if r["status"] != "PASS"]
+    assert not failed, f"Sweep points failed: {failed}"
@@ -0,0 +1,43 @@
+import pytest
+
+from soak import RingScoreboard, SoakBudget, ThroughputWindows, byteswap32, stream_expected
+
+
+def test_budget_from_env():
+    assert SoakBudget.from_env({}) is None
+    budget = SoakBudget.from_env({"SOAK_CYCLES": "1e3"})
+    assert not budget.exhausted(999)
+    assert budget.exhausted(1000)
+
+
+def test_ring_scoreboard_is_bounded():
+    sb = RingScoreboard("sb", depth=2, keep_mismatches=1)
+    sb.push(1)
+    sb.push(2)
+    with pytest.raises(AssertionError):
+        sb.push(3)
+    assert sb.check(1)
+    assert not sb.check(5)
+    assert sb.errors == 1 and sb.pending == 0
+    with pytest.raises(AssertionError):
+        sb.check(0)
+
+
+def test_throughput_windows_detect_drift():
+    windows = ThroughputWindows(window=10, warmup=1)
+    # warmup 윈도우(0 items)는 기준에서 제외
+    for rate in (0, 5, 5, 5):
+        for cycle in range(10):
+            windows.sample(1 if cycle < rate else 0)
+    assert windows.windows == 4
+    assert windows.steady(0.1)
+    for cycle in range(10):
+        windows.sample(1 if cycle < 2 else 0)
+    assert not windows.steady(0.1)
+
+
+def test_stream_expected_matches_rtl_math():
+    # swap(in) = 400, coeff 3 -> 1200 * 5243 >> 21 = 3 (= 1200 / 400)
+    word = byteswap32(400)
+    assert stream_expected(word, 3) == byteswap32((1200 * 5243) >> 21)
+    assert stream_expected(word, 3, bypass=True) == word
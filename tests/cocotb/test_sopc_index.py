@@ -0,0 +1,34 @@
+import os
+
+import sopc_index
+
+
+def test_index_system_clock_and_address_map(tmp_path):
+    index = sopc_index.load_index(cache_dir=str(tmp_path))
+    assert index.clock_hz("clk_0") == 50000000
+    assert index.clock_period_ns("stream_processor_simd") == 20.0
+    # 시스템에 없는 모듈은 시스템 클럭 사용
+    assert index.clock_period_ns("burst_master") == 20.0
+    assert index.instances_of("stream_processor_simd") == ["stream_multdiv_simd_0"]
+    assert index.base_address("stream_multdiv_simd_0.avalon_slave_0") == 0x10D0
+    assert index.base_address("mmio_0.s0", "dma_onchip_dp.mm_write") == 0xC0000
+    assert index.csr_words("stream_processor_simd") == 4
+    assert index.interface("stream_multdiv_simd_0", "avalon_streaming_sink_0")["data_width"] == 128
+    assert index.mb_per_s(2048, 1024) == 100.0
+
+
+def test_index_cache_keyed_on_file_hash(tmp_path):
+    first = sopc_index.load_index(cache_dir=str(tmp_path))
+    cached = os.listdir(tmp_path)
+    assert cached == [f"{first.data['sha256']}.json"]
+    second = sopc_index.load_index(cache_dir=str(tmp_path))
+    assert second.data == first.data
+
+
+def test_env_clock_period_and_mb_per_s(monkeypatch):
+    monkeypatch.delenv("CLOCK_PERIOD_NS", raising=False)
+    assert sopc_index.env_clock_period_ns() == 20.0
+    monkeypatch.setenv("CLOCK_PERIOD_NS", "10")
+    assert sopc_index.env_clock_period_ns() == 10.0
+    assert sopc_index.mb_per_s(2048, 1024, 20.0) == 100.0
+    assert sopc_index.mb_per_s(2048, 0, 20.0) == 0.0
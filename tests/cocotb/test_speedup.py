@@ -0,0 +1,23 @@
+import json
+
+import speedup
+
+
+def test_speedup_table_from_records(tmp_path, monkeypatch):
+    monkeypatch.setenv("CPU_COST_MODEL", json.dumps({"div": 100}))
+    record_dir = tmp_path / "burst_master_4"
+    record_dir.mkdir()
+    (record_dir / speedup.RECORD_NAME).write_text(json.dumps([{
+        "dut": "burst_master_4", "workload": "Mult + /400 (BM4)", "kernel": "mult_div",
+        "elements": 256, "hw_cycles": 1000, "clock_period_ns": 20.0,
+    }]))
+
+    model = speedup.cpu_cost_model()
+    assert model["div"] == 100
+    rows = speedup.build_table(speedup.load_records(str(tmp_path)), model)
+    per_element = sum(model[op] for op in speedup.SW_KERNELS["mult_div"])
+    assert rows[0]["sw_cycles"] == 256 * per_element
+    assert rows[0]["speedup"] == 256 * per_element / 1000
+
+    speedup.report(str(tmp_path))
+    assert (tmp_path / "speedup" / "speedup.md").exists()
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import sweep
+
+
+def test_grid_expansion():
+    grid = sweep.parse_grid(["FIFO_DEPTH=16,0x40", "DATA_WIDTH=32"])
+    assert grid == {"FIFO_DEPTH": [16, 64], "DATA_WIDTH": [32]}
+    assert sweep.expand_grid(grid) == [
+        {"FIFO_DEPTH": 16, "DATA_WIDTH": 32},
+        {"FIFO_DEPTH": 64, "DATA_WIDTH": 32},
+    ]
+    with pytest.raises(ValueError):
+        sweep.parse_grid(["FIFO_DEPTH"])
+
+
+def test_build_dir_is_content_addressed(tmp_path):
+    src = tmp_path / "fifo.v"
+    src.write_text("module simple_fifo; endmodule\n")
+    a = sweep.point_dir("sim_build", "simple_fifo", "tb", {"FIFO_DEPTH": 16, "DATA_WIDTH": 32}, [str(src)])
+    b = sweep.point_dir("sim_build", "simple_fifo", "tb", {"DATA_WIDTH": 32, "FIFO_DEPTH": 16}, [str(src)])
+    c = sweep.point_dir("sim_build", "simple_fifo", "tb", {"FIFO_DEPTH": 64, "DATA_WIDTH": 32}, [str(src)])
+    assert a == b != c
+    src.write_text("module simple_fifo; wire x; endmodule\n")
+    assert sweep.point_dir("sim_build", "simple_fifo", "tb", {"FIFO_DEPTH": 16, "DATA_WIDTH": 32}, [str(src)]) != a
+
+
+def test_m10k_estimate():
+    assert sweep.m10k_blocks(256, 32) == 1
+    assert sweep.m10k_blocks(512, 32) == 2
+    assert sweep.m10k_blocks(1024, 64) == 7
+
+
+def test_table_from_records(tmp_path):
+    path = sweep.write_record([{"profile": "none", "items_per_cycle": 1.0, "mb_per_s": 200.0, "p99": 3}],
+                              str(tmp_path))
+    results = [{"toplevel": "pipe_template", "params": {"STAGES": 3, "DATA_WIDTH": 32}, "status": "PASS",
+                "reason": "", "sim_build": str(tmp_path), "records": json.load(open(path))}]
+    table = sweep.format_table("pipe_template", results)
+    assert "| 3 | 32 | none | 1.000 | 200.0 | 3 | 99 FF | PASS |" in table
+
+
+def test_run_point_ignores_string_waves(tmp_path, monkeypatch):
+    """WAVES=off/full/... (test_runner 형식) 에서도 cocotb-test 인자 해석이 실패하지 않아야 함"""
+    simulator = pytest.importorskip("cocotb_test.simulator")
+    icarus = simulator.Icarus
+    monkeypatch.setenv("WAVES", "off")
+    # 시뮬레이터 실행 없이 인자 해석(Simulator.__init__)까지만 수행
+    monkeypatch.setattr(simulator, "run", lambda simulator=None, **kwargs: icarus(**kwargs))
+    result = sweep.run_point("simple_fifo", "tb_fifo_throughput", sweep.SWEEPS["simple_fifo"]["sources"],
+                             {"FIFO_DEPTH": 16}, str(tmp_path))
+    assert result["status"] == "PASS", result["reason"]
@@ -0,0 +1,118 @@
+import io
+
+import pytest
+
+from wave_analyzer import analyze_stream
+
+# 합성 VCD: clk 주기 10, rm 마스터가 burst 2 요청 (1 사이클 waitrequest) 후
+# 1 사이클 gap을 두고 readdatavalid 2회, aso 포트는 1회 stall 후 1 beat 전송
+# id code로 '#', 'b' 처럼 키워드와 헷갈리기 쉬운 문자를 일부러 사용
+VCD = """\
+$timescale 1ns $end
+$scope module burst_master $end
+$var wire 1 ! clk $end
+$var wire 1 " rm_read $end
+$var wire 1 # rm_waitrequest $end
+$var wire 8 b rm_burstcount [7:0] $end
+$var wire 1 % rm_readdatavalid $end
+$var wire 32 & rm_readdata [31:0] $end
+$var wire 1 ' aso_valid $end
+$var wire 1 ( aso_ready $end
+$var wire 32 ) aso_data [31:0] $end
+$scope module u_fifo $end
+$var wire 1 ! clk $end
+$var reg 10 * used_w [9:0] $end
+$upscope $end
+$upscope $end
+$enddefinitions $end
+#0
+$dumpvars
+0!
+0"
+1#
+bx b
+0%
+b0 &
+0'
+0(
+b0 )
+b0 *
+$end
+#5
+1!
+#7
+1"
+b10 b
+#10
+0!
+#15
+1!
+#17
+0#
+#20
+0!
+#25
+1!
+#27
+0"
+1#
+#30
+0!
+#35
+1!
+#40
+0!
+#45
+1!
+#47
+1%
+b1 *
+1'
+#50
+0!
+#55
+1!
+#57
+b10 *
+1(
+#60
+0!
+#65
+1!
+#67
+0%
+0'
+0(
+#70
+0!
+"""
+
+
+def analyze(text):
+    return analyze_stream(io.StringIO(text))
+
+
+def test_avalon_mm_metrics():
+    result = analyze(VCD)
+    rm = result["avalon_mm"]["rm"]
+    assert result["cycles"] == 7
+    assert rm["read_bursts"] == 1
+    assert rm["read_beats"] == 2
+    assert rm["waitrequest_stalls"] == 1
+    assert rm["readdatavalid_gaps"] == 2
+    assert rm["bytes"] == 8
+
+
+def test_avalon_st_and_fifo_metrics():
+    result = analyze(VCD)
+    aso = result["avalon_st"]["aso"]
+    assert aso["beats"] == 1
+    assert aso["stalls"] == 1
+    fifo = result["fifo"]["u_fifo"]
+    assert fifo["max"] == 2
+    assert fifo["min"] == 0
+
+
+def test_missing_clock():
+    with pytest.raises(ValueError):
+        analyze_stream(io.StringIO(VCD), clock="sys_clk")
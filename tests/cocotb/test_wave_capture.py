@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+import wave_capture
+
+RESULTS_XML = """\
+<testsuites>
+  <testsuite name="all">
+    <testcase name="test_a" sim_time_ns="1000" />
+    <testcase name="test_b" sim_time_ns="400"><failure message="mismatch" /></testcase>
+    <testcase name="test_c" sim_time_ns="800"><failure message="mismatch" /></testcase>
+  </testsuite>
+</testsuites>
+"""
+
+
+def test_first_failure_cycle(tmp_path):
+    path = tmp_path / "results.xml"
+    path.write_text(RESULTS_XML)
+    # test_a(1000ns) + test_b(400ns) = 1400ns / 20ns
+    assert wave_capture.first_failure_cycle(str(path), 20.0) == 70
+    assert wave_capture.first_failure_cycle(str(tmp_path / "missing.xml"), 20.0) is None
+
+
+def test_fst_reaches_vvp(tmp_path):
+    """WAVES_FORMAT=fst 의 -fst 가 실제 vvp 명령에 포함되는지 (cocotb-test 인자 이름 확인)"""
+    simulator = pytest.importorskip("cocotb_test.simulator")
+    import test_runner
+
+    spec = wave_capture.parse_wave_spec("window:10-20")
+    options = test_runner._sim_options("simple_fifo", "tb_fifo_throughput", [], str(tmp_path), spec, "fst")
+    sim = simulator.Icarus(**options)
+    cmd = sim.run_command()
+    # vvp 확장 인자는 sim 파일 뒤에 와야 한다
+    assert "-fst" in cmd[cmd.index(sim.sim_file) + 1:]
+
+
+def test_runner_hides_waves_spec(tmp_path, monkeypatch):
+    """WAVES=window:... 형식이 cocotb-test 의 int(WAVES) 해석에 걸리지 않아야 함"""
+    simulator = pytest.importorskip("cocotb_test.simulator")
+    import test_runner
+
+    icarus = simulator.Icarus
+    monkeypatch.setenv("WAVES", "window:10-20")
+    # 시뮬레이터 실행 없이 인자 해석(Simulator.__init__)까지만 수행
+    monkeypatch.setattr(test_runner, "run", lambda simulator=None, **kwargs: icarus(**kwargs))
+    test_runner._run_sim("simple_fifo", "tb_fifo_throughput", [], str(tmp_path))
+    assert os.environ["WAVES"] == "window:10-20"
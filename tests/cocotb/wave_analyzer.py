@@ -0,0 +1,403 @@
+"""
+Streaming VCD/FST 파형 분석기 (Offline Throughput & Protocol Metrics)
+
+덤프 파일을 한 줄씩 읽으면서(상수 메모리) 클럭 상승 에지마다 Avalon 신호를 샘플링하여
+Throughput/Stall 통계를 계산한다. 멀티 GB 파일도 통째로 메모리에 올리지 않는다.
+
+- Avalon-MM Master (rm_*, wm_* 등 <prefix>_read/_write + _waitrequest):
+  burst 수, beat 수, waitrequest stall, readdatavalid gap, bytes/cycle
+- Avalon-ST (asi_*, aso_* 등 <prefix>_valid + _ready): beat 수, backpressure stall, bytes/cycle
+- FIFO (used_w 를 가진 scope): 최소/최대/평균 점유
+
+FST 파일은 GTKWave의 fst2vcd 를 파이프로 연결하여 같은 방식으로 스트리밍한다.
+
+사용 예:
+    python wave_analyzer.py sim_build/burst_master/waves.vcd
+    python wave_analyzer.py sim_build/            # 하위 모든 .vcd/.fst 분석
+    python wave_analyzer.py waves.fst --clock clk --json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from contextlib import contextmanager
+
+
+# ============================================================================
+# VCD Tokenizer
+# ============================================================================
+
+class VcdVar:
+    __slots__ = ("code", "name", "scope", "width")
+
+    def __init__(self, code, name, scope, width):
+        self.code = code
+        self.name = name
+        self.scope = scope
+        self.width = width
+
+    @property
+    def path(self):
+        return ".".join(self.scope + [self.name])
+
+
+def parse_vcd(stream):
+    """VCD 스트림을 읽어 (vars, changes) 를 반환한다.
+
+    vars: 헤더에 선언된 VcdVar 리스트
+    changes: (time, [(code, value), ...]) 을 timestamp 단위로 생성하는 generator
+             value는 int, 또는 x/z 가 섞인 경우 None
+    """
+    variables = []
+    scope = []
+    for line in stream:
+        tokens = line.split()
+        if not tokens:
+            continue
+        key = tokens[0]
+        if key == "$scope":
+            scope.append(tokens[2])
+        elif key == "$upscope":
+            scope.pop()
+        elif key == "$var":
+            # $var wire 32 # rm_address [31:0] $end
+            variables.append(VcdVar(tokens[3], tokens[4], list(scope), int(tokens[2])))
+        elif key == "$enddefinitions":
+            break
+    return variables, _iter_changes(stream)
+
+
+_NO_VECTOR = object()
+
+
+def _to_int(bits):
+    try:
+        return int(bits, 2)
+    except ValueError:  # x / z
+        return None
+
+
+def _iter_changes(stream):
+    time = 0
+    batch = []
+    vector = _NO_VECTOR  # vector/real 값 다음 토큰은 항상 id code ('#', 'b' 로 시작할 수 있음)
+    for line in stream:
+        for token in line.split():
+            if vector is not _NO_VECTOR:
+                batch.append((token, vector))
+                vector = _NO_VECTOR
+                continue
+            c = token[0]
+            if c == "#":
+                if batch:
+                    yield time, batch
+                    batch = []
+                time = int(token[1:])
+            elif c in "01":
+                batch.append((token[1:], int(c)))
+            elif c in "xXzZ":
+                batch.append((token[1:], None))
+            elif c in "bB":
+                vector = _to_int(token[1:])
+            elif c in "rR":
+                vector = None  # real 값은 분석 대상 아님
+            # 그 외: $dumpvars / $dumpoff / $end 등 키워드는 무시
+    if batch:
+        yield time, batch
+
+
+@contextmanager
+def open_dump(path):
+    """VCD는 그대로, FST는 fst2vcd 출력을 스트림으로 연다."""
+    if path.endswith(".fst"):
+        try:
+            proc = subprocess.Popen(["fst2vcd", path], stdout=subprocess.PIPE, text=True)
+        except FileNotFoundError:
+            raise RuntimeError("fst2vcd (GTKWave) is required to analyze FST files")
+        try:
+            yield proc.stdout
+        finally:
+            proc.stdout.close()
+            proc.kill()
+            proc.wait()
+    else:
+        with open(path) as f:
+            yield f
+
+
+# ============================================================================
+# Metric Collectors (클럭 상승 에지마다 sample() 호출)
+# ============================================================================
+
+class AvalonMMStats:
+    """Avalon-MM Master 포트 통계"""
+
+    def __init__(self, prefix, sig, data_width):
+        self.prefix = prefix
+        self.sig = sig
+        self.bytes_per_beat = data_width // 8
+        self.read_bursts = 0
+        self.read_beats = 0
+        self.write_bursts = 0
+        self.write_beats = 0
+        self.waitrequest_stalls = 0
+        self.readdatavalid_gaps = 0
+        self.outstanding = 0  # 요청했지만 아직 도착하지 않은 read beat 수
+        self.write_left = 0   # 현재 write burst에서 남은 beat 수
+        self.first_cycle = None
+        self.last_cycle = None
+
+    def sample(self, cycle, v):
+        sig = self.sig
+        read = v(sig.get("read"))
+        write = v(sig.get("write"))
+        waitreq = v(sig.get("waitrequest"))
+        burst = v(sig.get("burstcount")) or 1
+        rdv = v(sig.get("readdatavalid"))
+
+        # readdatavalid 는 이전 사이클까지 요청된 beat 기준으로 gap 판정
+        if rdv:
+            self.read_beats += 1
+            self.outstanding = max(0, self.outstanding - 1)
+            self._active(cycle)
+        elif self.outstanding:
+            self.readdatavalid_gaps += 1
+
+        if (read or write) and waitreq:
+            self.waitrequest_stalls += 1
+        if read and not waitreq:
+            self.read_bursts += 1
+            self.outstanding += burst
+            self._active(cycle)
+        if write and not waitreq:
+            if self.write_left == 0:
+                self.write_bursts += 1
+                self.write_left = burst
+            self.write_left -= 1
+            self.write_beats += 1
+            self._active(cycle)
+
+    def _active(self, cycle):
+        if self.first_cycle is None:
+            self.first_cycle = cycle
+        self.last_cycle = cycle
+
+    def summary(self):
+        active = (self.last_cycle - self.first_cycle + 1) if self.first_cycle is not None else 0
+        beats = self.read_beats + self.write_beats
+        return {
+            "read_bursts": self.read_bursts,
+            "read_beats": self.read_beats,
+            "write_bursts": self.write_bursts,
+            "write_beats": self.write_beats,
+            "waitrequest_stalls": self.waitrequest_stalls,
+            "readdatavalid_gaps": self.readdatavalid_gaps,
+            "active_cycles": active,
+            "bytes": beats * self.bytes_per_beat,
+            "bytes_per_cycle": beats * self.bytes_per_beat / active if active else 0.0,
+        }
+
+
+class AvalonSTStats:
+    """Avalon-ST Sink/Source 포트 통계"""
+
+    def __init__(self, prefix, sig, data_width):
+        self.prefix = prefix
+        self.sig = sig
+        self.bytes_per_beat = max(1, data_width // 8)
+        self.beats = 0
+        self.stalls = 0
+        self.first_cycle = None
+        self.last_cycle = None
+
+    def sample(self, cycle, v):
+        valid = v(self.sig["valid"])
+        if not valid:
+            return
+        if v(self.sig["ready"]):
+            self.beats += 1
+            if self.first_cycle is None:
+                self.first_cycle = cycle
+            self.last_cycle = cycle
+        else:
+            self.stalls += 1
+
+    def summary(self):
+        active = (self.last_cycle - self.first_cycle + 1) if self.first_cycle is not None else 0
+        return {
+            "beats": self.beats,
+            "stalls": self.stalls,
+            "active_cycles": active,
+            "bytes": self.beats * self.bytes_per_beat,
+            "bytes_per_cycle": self.beats * self.bytes_per_beat / active if active else 0.0,
+        }
+
+
+class FifoLevelStats:
+    """simple_fifo used_w 레벨 통계"""
+
+    def __init__(self, name, code):
+        self.name = name
+        self.code = code
+        self.samples = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def sample(self, cycle, v):
+        level = v(self.code)
+        if level is None:
+            return
+        self.samples += 1
+        self.total += level
+        self.max = max(self.max, level)
+        self.min = level if self.min is None else min(self.min, level)
+
+    def summary(self):
+        return {
+            "min": self.min or 0,
+            "max": self.max,
+            "mean": self.total / self.samples if self.samples else 0.0,
+        }
+
+
+# ============================================================================
+# Analyzer
+# ============================================================================
+
+MM_PORTS = ("read", "write", "waitrequest", "burstcount", "readdatavalid")
+
+
+def _build_collectors(variables, clock):
+    """헤더 정보로부터 클럭 코드와 수집기 목록을 만든다 (top scope 기준)"""
+    top_depth = min(len(var.scope) for var in variables)
+    top = [var for var in variables if len(var.scope) == top_depth]
+    by_name = {var.name: var for var in top}
+
+    if clock not in by_name:
+        raise ValueError(f"Clock '{clock}' not found in top scope")
+    clock_code = by_name[clock].code
+
+    collectors = []
+    prefixes = sorted({name.rsplit("_", 1)[0] for name in by_name if "_" in name})
+    for prefix in prefixes:
+        ports = {p: by_name[f"{prefix}_{p}"].code for p in MM_PORTS if f"{prefix}_{p}" in by_name}
+        if "waitrequest" in ports and ("read" in ports or "write" in ports):
+            data = by_name.get(f"{prefix}_readdata") or by_name.get(f"{prefix}_writedata")
+            collectors.append(AvalonMMStats(prefix, ports, data.width if data else 32))
+        elif f"{prefix}_valid" in by_name and f"{prefix}_ready" in by_name:
+            ports = {"valid": by_name[f"{prefix}_valid"].code, "ready": by_name[f"{prefix}_ready"].code}
+            data = by_name.get(f"{prefix}_data")
+            collectors.append(AvalonSTStats(prefix, ports, data.width if data else 32))
+
+    for var in variables:
+        if var.name == "used_w" and len(var.scope) > top_depth:
+            collectors.append(FifoLevelStats(".".join(var.scope[top_depth:]), var.code))
+
+    return clock_code, collectors
+
+
+def analyze_stream(stream, clock="clk"):
+    """VCD 텍스트 스트림을 분석하여 결과 dict를 반환한다."""
+    variables, changes = parse_vcd(stream)
+    if not variables:
+        raise ValueError("No variables found in dump header")
+    clock_code, collectors = _build_collectors(variables, clock)
+
+    # 추적 대상 신호의 현재 값만 유지 (상수 메모리)
+    tracked = {clock_code}
+    for c in collectors:
+        if isinstance(c, FifoLevelStats):
+            tracked.add(c.code)
+        else:
+            tracked.update(c.sig.values())
+    state = dict.fromkeys(tracked)
+    value = state.get
+
+    cycles = 0
+    first_time = last_time = None
+    for time, batch in changes:
+        # 같은 timestamp의 변경 중 클럭 상승이 있으면, 변경 적용 "이전" 값으로 샘플링 (플립플롭 관점)
+        for code, val in batch:
+            if code == clock_code and val == 1 and state[clock_code] == 0:
+                cycles += 1
+                for c in collectors:
+                    c.sample(cycles, value)
+                if first_time is None:
+                    first_time = time
+                last_time = time
+                break
+        for code, val in batch:
+            if code in state:
+                state[code] = val
+
+    result = {
+        "cycles": cycles,
+        "first_edge_time": first_time,
+        "last_edge_time": last_time,
+        "avalon_mm": {},
+        "avalon_st": {},
+        "fifo": {},
+    }
+    for c in collectors:
+        if isinstance(c, AvalonMMStats):
+            result["avalon_mm"][c.prefix] = c.summary()
+        elif isinstance(c, AvalonSTStats):
+            result["avalon_st"][c.prefix] = c.summary()
+        else:
+            result["fifo"][c.name] = c.summary()
+    return result
+
+
+def analyze_file(path, clock="clk"):
+    with open_dump(path) as stream:
+        return analyze_stream(stream, clock)
+
+
+def find_dumps(path):
+    """파일이면 그대로, 디렉토리면 하위의 모든 .vcd/.fst 파일"""
+    if os.path.isfile(path):
+        return [path]
+    dumps = []
+    for root, _, files in os.walk(path):
+        dumps += [os.path.join(root, f) for f in sorted(files) if f.endswith((".vcd", ".fst"))]
+    return dumps
+
+
+def format_report(path, result):
+    lines = [f"=== {path} ({result['cycles']} cycles) ==="]
+    for prefix, s in result["avalon_mm"].items():
+        lines.append(f"  [MM {prefix}] rd {s['read_bursts']} bursts/{s['read_beats']} beats, "
+                     f"wr {s['write_bursts']} bursts/{s['write_beats']} beats, "
+                     f"waitreq stall {s['waitrequest_stalls']}, rdv gap {s['readdatavalid_gaps']}, "
+                     f"{s['bytes_per_cycle']:.2f} B/cycle")
+    for prefix, s in result["avalon_st"].items():
+        lines.append(f"  [ST {prefix}] {s['beats']} beats, stall {s['stalls']}, "
+                     f"{s['bytes_per_cycle']:.2f} B/cycle")
+    for name, s in result["fifo"].items():
+        lines.append(f"  [FIFO {name}] level min {s['min']} / mean {s['mean']:.1f} / max {s['max']}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming VCD/FST Avalon throughput analyzer")
+    parser.add_argument("paths", nargs="+", help="Dump files or directories (e.g. sim_build/)")
+    parser.add_argument("--clock", default="clk", help="Clock signal name in the top scope")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for path in args.paths:
+        for dump in find_dumps(path):
+            results[dump] = analyze_file(dump, args.clock)
+            if not args.json:
+                print(format_report(dump, results[dump]))
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+파형 캡처 제어 (Triggered / Windowed Waveform Capture)
+
+항상 전체 VCD를 덤프하면 큰 전송에서 시뮬레이션이 크게 느려지므로,
+기본값은 덤프 OFF 이고 필요한 구간만 캡처한다.
+
+WAVES 환경 변수 (또는 run_module의 waves 인자) 형식:
+    off                         덤프 안함 (기본값)
+    full                        전체 덤프
+    window:START-END            클럭 사이클 START ~ END 구간만 덤프
+    trigger:SIGNAL==VALUE[:PRE[:POST]]
+                                SIGNAL(toplevel 기준 계층명)이 VALUE가 되는 첫 사이클 기준
+                                PRE 사이클 전 ~ POST 사이클 후 구간 덤프
+    mismatch[:PRE[:POST]]       덤프 없이 실행 후, 실패한 경우에만 첫 실패 지점 주변을 재시뮬레이션하여 덤프
+                                (실패 지점 = 첫 번째 실패 테스트가 끝난 사이클. 불일치 즉시 assert 하는
+                                 테스트벤치에서는 첫 불일치 사이클과 같고, 오류를 모아 마지막에 assert 하는
+                                 테스트벤치에서는 테스트 종료 시점이므로 PRE 를 넉넉히 잡는다)
+
+WAVES_FORMAT=vcd|fst 로 출력 포맷을 선택한다 (기본값 vcd).
+
+구현: 사이클 카운터와 $dumpon/$dumpoff 를 가진 wave_ctrl 모듈을 생성하여 DUT와 함께
+두 번째 top-level로 컴파일한다. VCD/FST는 과거 값을 되돌려 기록할 수 없으므로
+PRE > 0 인 trigger/mismatch 모드는 1차 실행에서 기준 사이클을 찾고 2차 실행에서 해당 구간만 덤프한다.
+"""
+import contextlib
+import os
+import re
+import xml.etree.ElementTree as ET
+from collections import namedtuple
+
+WaveSpec = namedtuple("WaveSpec", "mode start end trigger pre post")
+
+DEFAULT_PRE = 200
+DEFAULT_POST = 200
+END_OF_SIM = 2**31 - 1
+
+_TRIGGER_RE = re.compile(r"^([\w.\[\]]+)\s*(==|!=)\s*([\w']+)$")
+
+
+def parse_wave_spec(spec):
+    """WAVES 문자열을 WaveSpec으로 변환한다. 형식이 잘못되면 ValueError."""
+    spec = (spec or "off").strip()
+    mode, _, rest = spec.partition(":")
+    mode = mode.lower()
+
+    if mode in ("off", "0", "false", ""):
+        return WaveSpec("off", 0, 0, None, 0, 0)
+    if mode in ("full", "1", "true"):
+        return WaveSpec("full", 0, END_OF_SIM, None, 0, 0)
+    if mode == "window":
+        m = re.match(r"^(\d+)-(\d+)$", rest)
+        if not m or int(m.group(1)) >= int(m.group(2)):
+            raise ValueError(f"Invalid window spec '{spec}' (expected window:START-END)")
+        return WaveSpec("window", int(m.group(1)), int(m.group(2)), None, 0, 0)
+    if mode == "trigger":
+        cond, *depths = rest.split(":")
+        m = _TRIGGER_RE.match(cond.strip())
+        if not m:
+            raise ValueError(f"Invalid trigger spec '{spec}' (expected trigger:SIGNAL==VALUE[:PRE[:POST]])")
+        pre, post = _parse_depths(spec, depths)
+        return WaveSpec("trigger", 0, 0, m.groups(), pre, post)
+    if mode == "mismatch":
+        pre, post = _parse_depths(spec, rest.split(":") if rest else [])
+        return WaveSpec("mismatch", 0, 0, None, pre, post)
+    raise ValueError(f"Unknown WAVES mode '{spec}'")
+
+
+def _parse_depths(spec, depths):
+    if len(depths) > 2 or not all(d.isdigit() for d in depths):
+        raise ValueError(f"Invalid pre/post depth in '{spec}'")
+    pre = int(depths[0]) if len(depths) > 0 else DEFAULT_PRE
+    post = int(depths[1]) if len(depths) > 1 else DEFAULT_POST
+    return pre, post
+
+
+def window_around(cycle, pre, post):
+    """기준 사이클 주변의 window WaveSpec"""
+    return WaveSpec("window", max(0, cycle - pre), cycle + post, None, 0, 0)
+
+
+def dump_path(sim_build, fmt):
+    return os.path.abspath(os.path.join(sim_build, f"waves.{fmt}"))
+
+
+def trigger_path(sim_build):
+    return os.path.abspath(os.path.join(sim_build, "wave_trigger.txt"))
+
+
+def write_wave_ctrl(sim_build, toplevel, spec, fmt="vcd", clk="clk", detect_only=False):
+    """wave_ctrl.v 를 생성하고 경로를 반환한다.
+
+    detect_only=True 이면 덤프는 하지 않고 trigger 사이클만 wave_trigger.txt 에 기록한다.
+    """
+    os.makedirs(sim_build, exist_ok=True)
+    lines = [
+        "// Auto-generated by wave_capture.py - do not edit",
+        "module wave_ctrl;",
+        "    integer cycle = 0;",
+        "    integer stop_at = 0;",
+        "    integer trig_fd;",
+        "    reg     dumping = 0;",
+        "    reg     triggered = 0;",
+        "",
+        "    initial begin",
+    ]
+    if detect_only:
+        # 이전 실행의 결과가 남아 있으면 잘못된 구간을 덤프하게 됨
+        if os.path.exists(trigger_path(sim_build)):
+            os.remove(trigger_path(sim_build))
+        lines.append(f'        trig_fd = $fopen("{trigger_path(sim_build)}", "w");')
+    else:
+        lines += [
+            f'        $dumpfile("{dump_path(sim_build, fmt)}");',
+            f"        $dumpvars(0, {toplevel});",
+        ]
+        if spec.mode == "full":
+            lines.append("        dumping = 1;")
+        else:
+            lines.append("        $dumpoff;")
+    lines += ["    end", ""]
+
+    if spec.mode in ("window", "trigger"):
+        lines += [f"    always @(posedge {toplevel}.{clk}) begin", "        cycle = cycle + 1;"]
+        if spec.mode == "window":
+            lines += [
+                f"        if (!dumping && cycle >= {spec.start} && cycle < {spec.end}) begin",
+                "            $dumpon;",
+                "            dumping = 1;",
+                f"        end else if (dumping && cycle >= {spec.end}) begin",
+                "            $dumpoff;",
+                "            dumping = 0;",
+                "        end",
+            ]
+        else:
+            signal, op, value = spec.trigger
+            lines.append(f"        if (!triggered && ({toplevel}.{signal} {op} {value})) begin")
+            lines.append("            triggered = 1;")
+            if detect_only:
+                lines += [
+                    '            $fdisplay(trig_fd, "%0d", cycle);',
+                    "            $fflush(trig_fd);",
+                ]
+            else:
+                lines += [
+                    f"            stop_at = cycle + {spec.post};",
+                    "            $dumpon;",
+                    "            dumping = 1;",
+                    "        end else if (dumping && cycle >= stop_at) begin",
+                    "            $dumpoff;",
+                    "            dumping = 0;",
+                ]
+            lines.append("        end")
+        lines.append("    end")
+
+    lines += ["", "endmodule", ""]
+
+    path = os.path.join(sim_build, "wave_ctrl.v")
+    with open(path, "w") as f:
+        f.write("\n".join(lines))
+    return path
+
+
+def read_trigger_cycle(sim_build):
+    """detect_only 실행에서 기록된 trigger 사이클 (없으면 None)"""
+    try:
+        with open(trigger_path(sim_build)) as f:
+            text = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return int(text.splitlines()[0]) if text else None
+
+
+def first_failure_cycle(results_xml, clock_period_ns):
+    """results.xml 에서 첫 번째 실패 테스트가 끝난 시점을 클럭 사이클로 환산한다.
+
+    cocotb는 sim_time_ns 를 테스트별 경과 시간으로 기록하므로 순서대로 누적한다.
+    스코어보드의 첫 불일치 사이클이 아니라 실패한 테스트가 끝난 사이클의 근사값이다
+    (불일치에서 바로 assert 하면 두 값이 같다).
+    """
+    try:
+        root = ET.parse(results_xml).getroot()
+    except (FileNotFoundError, ET.ParseError):
+        return None
+    elapsed_ns = 0.0
+    for case in root.iter("testcase"):
+        elapsed_ns += float(case.get("sim_time_ns", 0))
+        if case.find("failure") is not None or case.find("error") is not None:
+            return int(elapsed_ns // clock_period_ns)
+    return None
+
+
+@contextlib.contextmanager
+def hide_waves_env():
+    """cocotb-test 실행 동안 WAVES 환경 변수를 숨긴다.
+
+    cocotb-test 0.2.6은 waves 인자와 관계없이 int(os.getenv("WAVES", 0)) 을 먼저 평가하므로
+    off/full/window:... 형식의 WAVES 가 있으면 ValueError 로 실행 자체가 실패한다.
+    """
+    saved = os.environ.pop("WAVES", None)
+    try:
+        yield
+    finally:
+        if saved is not None:
+            os.environ["WAVES"] = saved
+
+
+def sim_args(fmt):
+    """Icarus vvp 확장 인자 (sim 파일 뒤에 붙음)"""
+    return ["-fst"] if fmt == "fst" else []
@@ -23,7 +23,7 @@ def test_burst_master():
             tests_dir
         ],
         sim="iverilog",
-        waves=True,
+        waves=os.environ.get("WAVES", "off") == "full",
         force_compile=True
     )
 